@@ -1,9 +1,79 @@
 import json
 import math
+import os
+import sys
+import numpy as np
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from rich.console import Console
+    from rich.table import Table
+except ImportError:
+    Console = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+def _json_dumps(data) -> bytes:
+    """Serialize to indented JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+def _json_line(data) -> bytes:
+    """Serialize to a single compact JSON line, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data) + b"\n"
+    return json.dumps(data).encode() + b"\n"
+
+def _json_loads(raw: bytes):
+    """Parse JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _compute_levels_loop(level_col, attr_of, lut_attr, lut_overall):
+    """Sum skill levels per attribute and map totals through the sigmoid tables in one pass"""
+    n_attrs = attr_of[-1] + 1
+    totals = np.zeros(n_attrs, dtype=np.int64)
+    for i in range(level_col.shape[0]):
+        totals[attr_of[i]] += level_col[i]
+    
+    attr_levels = np.empty(n_attrs, dtype=np.uint8)
+    overall_points = np.int64(0)
+    for a in range(n_attrs):
+        attr_levels[a] = lut_attr[min(totals[a], lut_attr.shape[0] - 1)]
+        overall_points += attr_levels[a]
+    return attr_levels, np.int64(lut_overall[min(overall_points, lut_overall.shape[0] - 1)])
+
+def _compute_levels_numpy(level_col, attr_of, lut_attr, lut_overall):
+    """Same result as _compute_levels_loop using whole-array NumPy operations"""
+    totals = np.bincount(attr_of, weights=level_col).astype(np.intp)
+    attr_levels = lut_attr[np.minimum(totals, lut_attr.shape[0] - 1)]
+    overall_points = min(int(attr_levels.sum()), lut_overall.shape[0] - 1)
+    return attr_levels, np.int64(lut_overall[overall_points])
+
+# Numba is optional: compile the loop kernel when it is installed, otherwise use the
+# NumPy version so the level pipeline never runs element-by-element in the interpreter
+if njit is not None:
+    _compute_levels = njit("Tuple((uint8[::1], int64))(uint8[::1], intp[::1], uint8[::1], uint8[::1])",
+                           cache=True)(_compute_levels_loop)
+else:
+    _compute_levels = _compute_levels_numpy
 
 class SoloLevelingSystem:
+    # uint8 sigmoid tables shared by all instances, keyed by max_points
+    _sigmoid_luts: Dict[int, np.ndarray] = {}
+    
     def __init__(self):
         self.attributes = {
             "life_skills": [
@@ -33,17 +103,59 @@ class SoloLevelingSystem:
             ]
         }
         
-        # Initialize skill levels (starting at level 1)
-        self.skill_levels = {}
-        for attribute in self.attributes:
-            self.skill_levels[attribute] = {}
-            for skill in self.attributes[attribute]:
-                self.skill_levels[attribute][skill] = 1
+        # Skill levels are stored column-wise: one flat level array plus parallel
+        # attribute-id and name columns, all indexed by flat skill position
+        self.attr_names = list(self.attributes)
+        self._attr_index = {attr: attr_idx for attr_idx, attr in enumerate(self.attr_names)}
+        self._skill_names = [skill for attr in self.attr_names for skill in self.attributes[attr]]
+        self._attr_of = np.repeat(np.arange(len(self.attr_names), dtype=np.intp),
+                                  [len(self.attributes[attr]) for attr in self.attr_names])
+        self._skill_index = {(self.attr_names[attr_idx], skill): i
+                             for i, (attr_idx, skill) in enumerate(zip(self._attr_of, self._skill_names))}
+        # Levels are bounded to 1..100, so one unsigned byte per skill is enough
+        self._level_col = np.ones(len(self._skill_names), dtype=np.uint8)
+        
+        # Display labels never change, so format them once
+        self._attr_display = {attr: attr.replace("_", " ").title() for attr in self.attr_names}
+        self._skill_display = [skill.replace("_", " ").title() for skill in self._skill_names]
+        
+        # Level scales are fixed by the attribute/skill structure
+        self._max_skill_points = len(self.attributes[self.attr_names[0]]) * 100  # 10 skills * 100 max each
+        self._max_attribute_points = len(self.attr_names) * 100                  # 5 attributes * 100 max each
+        
+        # Totals are small bounded integers, so the sigmoid is tabulated once up front
+        self._lut_attr = self._build_sigmoid_lut(self._max_skill_points)
+        self._lut_overall = self._build_sigmoid_lut(self._max_attribute_points)
+        
+        # Computed levels are cached until a skill level changes
+        self._dirty = True
+        self._cached_attr_levels = None
+        self._cached_overall = None
+        
+        # With rich installed, the stats screen is rendered as one table in a single frame
+        self._console = Console() if Console is not None else None
         
         self.data_file = "leveling_data.json"
+        self.sessions_file = "leveling_sessions.jsonl"
         self.load_data()
     
     def sigmoid_level_calculation(self, total_points: int, max_points: int) -> int:
+        """Calculate level using the precomputed sigmoid tables where the input is in range"""
+        if max_points == self._max_skill_points and 0 <= total_points <= max_points:
+            return int(self._lut_attr[total_points])
+        if max_points == self._max_attribute_points and 0 <= total_points <= max_points:
+            return int(self._lut_overall[total_points])
+        return self._compute_sigmoid(total_points, max_points)
+    
+    def _build_sigmoid_lut(self, max_points: int) -> np.ndarray:
+        """Tabulate _compute_sigmoid for every integer total from 0 to max_points (once per process)"""
+        lut = self._sigmoid_luts.get(max_points)
+        if lut is None:
+            lut = np.array([self._compute_sigmoid(p, max_points) for p in range(max_points + 1)], dtype=np.uint8)
+            self._sigmoid_luts[max_points] = lut
+        return lut
+    
+    def _compute_sigmoid(self, total_points: int, max_points: int) -> int:
         """
         Calculate level using sigmoid curve for realistic learning progression
         - Slow start (learning curve)
@@ -64,37 +176,78 @@ class SoloLevelingSystem:
         level = int(1 + sigmoid_value * 99)
         return min(level, 100)
     
+    def get_level(self, attribute: str, skill: str) -> int:
+        """Read a single skill level from the packed level column"""
+        return int(self._level_col[self._skill_index[(attribute, skill)]])
+    
+    def set_level(self, attribute: str, skill: str, level: int):
+        """Write a skill level and invalidate the cached attribute/overall levels"""
+        self._level_col[self._skill_index[(attribute, skill)]] = level
+        self._dirty = True
+    
+    def compute_all_levels(self) -> Tuple[List[int], int]:
+        """Return (attribute levels in attr_names order, overall level) from one computation"""
+        if self._dirty:
+            attr_levels, overall = _compute_levels(self._level_col, self._attr_of, self._lut_attr, self._lut_overall)
+            self._cached_attr_levels = attr_levels.tolist()
+            self._cached_overall = int(overall)
+            self._dirty = False
+        return self._cached_attr_levels, self._cached_overall
+    
     def calculate_attribute_level(self, attribute: str) -> int:
         """Calculate attribute level based on sum of all skills in that attribute"""
-        total_skill_points = sum(self.skill_levels[attribute].values())
-        max_skill_points = len(self.attributes[attribute]) * 100  # 10 skills * 100 max each
-        return self.sigmoid_level_calculation(total_skill_points, max_skill_points)
+        return self.compute_all_levels()[0][self._attr_index[attribute]]
     
     def calculate_overall_level(self) -> int:
         """Calculate overall level based on sum of all attribute levels"""
-        total_attribute_points = sum(self.calculate_attribute_level(attr) for attr in self.attributes)
-        max_attribute_points = len(self.attributes) * 100  # 5 attributes * 100 max each
-        return self.sigmoid_level_calculation(total_attribute_points, max_attribute_points)
+        return self.compute_all_levels()[1]
     
     def display_current_stats(self):
         """Display current player statistics"""
-        print("\n" + "="*60)
-        print("🎮 SOLO LEVELING SYSTEM - CURRENT STATS 🎮")
-        print("="*60)
+        attr_levels, overall_level = self.compute_all_levels()
+        
+        if self._console is not None:
+            self._console.print()
+            self._console.print(self._build_stats_table(attr_levels, overall_level))
+            return
+        
+        # Build the whole screen first and emit it with a single write
+        out = ["\n" + "="*60]
+        out.append("🎮 SOLO LEVELING SYSTEM - CURRENT STATS 🎮")
+        out.append("="*60)
         
-        overall_level = self.calculate_overall_level()
-        print(f"🏆 OVERALL LEVEL: {overall_level}/100")
-        print("-"*60)
+        out.append(f"🏆 OVERALL LEVEL: {overall_level}/100")
+        out.append("-"*60)
         
-        for attribute_name in self.attributes:
-            attr_level = self.calculate_attribute_level(attribute_name)
-            attr_display = attribute_name.replace("_", " ").title()
-            print(f"\n📊 {attr_display} - Level {attr_level}/100:")
+        prev_attr = -1
+        for attr_idx, skill_display, skill_level in zip(self._attr_of, self._skill_display, self._level_col):
+            if attr_idx != prev_attr:
+                attr_display = self._attr_display[self.attr_names[attr_idx]]
+                out.append(f"\n📊 {attr_display} - Level {attr_levels[attr_idx]}/100:")
+                prev_attr = attr_idx
             
-            for skill in self.attributes[attribute_name]:
-                skill_display = skill.replace("_", " ").title()
-                skill_level = self.skill_levels[attribute_name][skill]
-                print(f"   • {skill_display}: {skill_level}/100")
+            out.append(f"   • {skill_display}: {skill_level}/100")
+        
+        sys.stdout.write("\n".join(out) + "\n")
+    
+    def _build_stats_table(self, attr_levels: List[int], overall_level: int) -> "Table":
+        """Build the rich table for the stats screen: one section per attribute"""
+        table = Table(title=f"🎮 SOLO LEVELING SYSTEM - CURRENT STATS 🎮\n🏆 OVERALL LEVEL: {overall_level}/100",
+                      show_header=False)
+        table.add_column("Skill")
+        table.add_column("Level", justify="right")
+        
+        prev_attr = -1
+        for attr_idx, skill_display, skill_level in zip(self._attr_of, self._skill_display, self._level_col):
+            if attr_idx != prev_attr:
+                if prev_attr != -1:
+                    table.add_section()
+                attr_display = self._attr_display[self.attr_names[attr_idx]]
+                table.add_row(f"📊 {attr_display}", f"{attr_levels[attr_idx]}/100", style="bold")
+                prev_attr = attr_idx
+            
+            table.add_row(f"   • {skill_display}", f"{skill_level}/100")
+        return table
     
     def update_skills_session(self):
         """Interactive session to update skill levels"""
@@ -104,54 +257,57 @@ class SoloLevelingSystem:
         print("Enter new levels for each skill (max +10 increase per session)")
         print("Press Enter to keep current level")
         
+        # One timestamp for the whole session, shared by the history entry and the save
+        now_iso = datetime.now().isoformat()
         session_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso,
             "updates": {}
         }
         
-        for attribute_name in self.attributes:
-            attr_display = attribute_name.replace("_", " ").title()
-            print(f"\n🎯 UPDATING: {attr_display}")
+        for attribute_name in self.attr_names:
+            print(f"\n🎯 UPDATING: {self._attr_display[attribute_name]}")
             print("-" * 30)
             
             session_data["updates"][attribute_name] = {}
             
             for skill in self.attributes[attribute_name]:
-                skill_display = skill.replace("_", " ").title()
-                current_level = self.skill_levels[attribute_name][skill]
+                skill_display = self._skill_display[self._skill_index[(attribute_name, skill)]]
+                current_level = self.get_level(attribute_name, skill)
                 
+                max_level = min(current_level + 10, 100)
                 while True:
-                    try:
-                        user_input = input(f"{skill_display} [{current_level}] → ").strip()
-                        
-                        if user_input == "":
-                            # Keep current level
-                            new_level = current_level
-                            break
-                        
+                    user_input = input(f"{skill_display} [{current_level}] → ").strip()
+                    
+                    if user_input == "":
+                        # Keep current level
+                        new_level = current_level
+                        break
+                    
+                    # Plain digits skip the exception path; anything else still gets
+                    # int()'s full syntax (+3, -3, 1_0) as before
+                    if user_input.isdecimal():
                         new_level = int(user_input)
-                        
-                        # Validate constraints
-                        if new_level < current_level:
-                            print("   ❌ Cannot decrease levels!")
-                            continue
-                        
-                        if new_level > current_level + 10:
-                            print("   ❌ Maximum increase of 10 levels per session!")
+                    else:
+                        try:
+                            new_level = int(user_input)
+                        except ValueError:
+                            print("   ❌ Please enter a valid number or press Enter to skip")
                             continue
-                        
-                        if new_level > 100:
-                            print("   ❌ Maximum level is 100!")
-                            continue
-                        
+                    
+                    # Validate constraints; only work out which one failed on the slow path
+                    if current_level <= new_level <= max_level:
                         break
                     
-                    except ValueError:
-                        print("   ❌ Please enter a valid number or press Enter to skip")
+                    if new_level < current_level:
+                        print("   ❌ Cannot decrease levels!")
+                    elif new_level > current_level + 10:
+                        print("   ❌ Maximum increase of 10 levels per session!")
+                    else:
+                        print("   ❌ Maximum level is 100!")
                 
                 # Update the skill level
-                old_level = self.skill_levels[attribute_name][skill]
-                self.skill_levels[attribute_name][skill] = new_level
+                old_level = current_level
+                self.set_level(attribute_name, skill, new_level)
                 session_data["updates"][attribute_name][skill] = {
                     "old_level": old_level,
                     "new_level": new_level,
@@ -161,88 +317,134 @@ class SoloLevelingSystem:
                 if new_level > old_level:
                     print(f"   ✅ +{new_level - old_level} levels!")
         
-        # Save session data
+        # Append the session to the history file and write the new skill snapshot
         self.save_session(session_data)
-        self.save_data()
+        self.save_data(now_iso)
         
         print("\n🎉 Session complete! Progress saved.")
         self.display_session_summary(session_data)
     
     def display_session_summary(self, session_data: dict):
         """Display summary of the update session"""
-        print("\n" + "="*50)
-        print("📈 SESSION SUMMARY")
-        print("="*50)
+        out = ["\n" + "="*50]
+        out.append("📈 SESSION SUMMARY")
+        out.append("="*50)
         
         total_gains = 0
         for attribute_name in session_data["updates"]:
             attr_gains = sum(update["gain"] for update in session_data["updates"][attribute_name].values())
             if attr_gains > 0:
-                attr_display = attribute_name.replace("_", " ").title()
-                print(f"{attr_display}: +{attr_gains} total levels")
+                out.append(f"{self._attr_display[attribute_name]}: +{attr_gains} total levels")
                 total_gains += attr_gains
         
         if total_gains > 0:
-            print(f"\n🚀 Total session gains: +{total_gains} levels")
-            old_overall = self.calculate_overall_level() # This might not be accurate since we already updated
-            print(f"🏆 Current Overall Level: {self.calculate_overall_level()}/100")
+            out.append(f"\n🚀 Total session gains: +{total_gains} levels")
+            out.append(f"🏆 Current Overall Level: {self.calculate_overall_level()}/100")
         else:
-            print("No changes made this session.")
+            out.append("No changes made this session.")
+        
+        sys.stdout.write("\n".join(out) + "\n")
     
-    def save_data(self):
+    def save_data(self, timestamp: Optional[str] = None):
         """Save current skill levels to JSON file"""
-        try:
-            with open(self.data_file, 'r') as f:
-                data = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            data = {"skill_levels": {}, "sessions": []}
-        
-        data["skill_levels"] = self.skill_levels
-        data["last_updated"] = datetime.now().isoformat()
-        
-        with open(self.data_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        self._persisted["skill_levels"] = self.skill_levels_dict()
+        self._persisted["last_updated"] = timestamp or datetime.now().isoformat()
+        self._flush()
     
     def save_session(self, session_data: dict):
-        """Save session data for historical tracking"""
-        try:
-            with open(self.data_file, 'r') as f:
-                data = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            data = {"skill_levels": {}, "sessions": []}
-        
-        if "sessions" not in data:
-            data["sessions"] = []
-        
-        data["sessions"].append(session_data)
-        
-        with open(self.data_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        """Append session data to the JSONL history file for historical tracking"""
+        self._migrate_legacy_sessions()
+        self._append_sessions([session_data])
+    
+    def _append_sessions(self, sessions: List[dict]):
+        """Append sessions to the history file, one JSON object per line"""
+        with open(self.sessions_file, 'ab') as f:
+            f.write(b"".join(_json_line(session) for session in sessions))
+    
+    def _flush(self):
+        """Write the in-memory copy of the data file back to disk"""
+        # The sessions were popped from _persisted; move them out before the rewrite drops them
+        self._append_legacy_sessions()
+        # Write beside the file and rename over it, so a crash never leaves it half-written
+        tmp_file = self.data_file + ".tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(_json_dumps(self._persisted))
+        os.replace(tmp_file, self.data_file)
+    
+    def skill_levels_dict(self) -> Dict[str, Dict[str, int]]:
+        """Convert the level column back to the nested dict layout used in the JSON file"""
+        data = {attribute: {} for attribute in self.attr_names}
+        for attr_idx, skill, level in zip(self._attr_of, self._skill_names, self._level_col.tolist()):
+            data[self.attr_names[attr_idx]][skill] = level
+        return data
     
     def load_data(self):
-        """Load skill levels from JSON file"""
+        """Load skill levels from JSON file, keeping the parsed contents for later saves"""
+        self._persisted = {"skill_levels": {}}
         try:
-            with open(self.data_file, 'r') as f:
-                data = json.load(f)
-                if "skill_levels" in data:
-                    # Merge saved data with default structure
-                    for attribute in data["skill_levels"]:
-                        if attribute in self.skill_levels:
-                            for skill in data["skill_levels"][attribute]:
-                                if skill in self.skill_levels[attribute]:
-                                    self.skill_levels[attribute][skill] = data["skill_levels"][attribute][skill]
+            with open(self.data_file, 'rb') as f:
+                data = _json_loads(f.read())
+                self._persisted = data
+                # Merge saved data with default structure: keep only known skills and
+                # write them into the level column in one vectorized assignment. A hand-edited
+                # file can hold anything, so non-integers are skipped and levels clamped to
+                # 1..100 before they reach the uint8 column
+                saved = {(attribute, skill): min(max(level, 1), 100)
+                         for attribute, skills in data.get("skill_levels", {}).items()
+                         for skill, level in skills.items()
+                         if isinstance(level, int) and not isinstance(level, bool)}
+                known = saved.keys() & self._skill_index.keys()
+                if known:
+                    self._level_col[[self._skill_index[key] for key in known]] = [saved[key] for key in known]
+                    self._dirty = True
         except (FileNotFoundError, json.JSONDecodeError):
             # File doesn't exist or is corrupted, use defaults
             pass
+        
+        # Older data files kept the session history inline. It is moved to the JSONL file
+        # the first time history is touched, so startup never opens the history file.
+        self._legacy_sessions = self._persisted.pop("sessions", None)
+    
+    def _migrate_legacy_sessions(self):
+        """Move inline sessions from an older data file into the JSONL history file"""
+        if self._legacy_sessions:
+            self._flush()
+    
+    def _append_legacy_sessions(self):
+        """Append the inline sessions to the history file unless a crashed migration already did"""
+        legacy_sessions, self._legacy_sessions = self._legacy_sessions, None
+        if not legacy_sessions:
+            return
+        
+        # Appending happens before the data file is rewritten without the sessions; if the
+        # process died in between, they are already the last lines of the history file
+        lines = [_json_line(session) for session in legacy_sessions]
+        try:
+            with open(self.sessions_file, 'rb') as f:
+                tail = list(deque(f, maxlen=len(lines)))
+        except FileNotFoundError:
+            tail = []
+        if tail != lines:
+            with open(self.sessions_file, 'ab') as f:
+                f.write(b"".join(lines))
     
     def view_history(self):
         """View session history"""
+        self._migrate_legacy_sessions()
         try:
-            with open(self.data_file, 'r') as f:
-                data = json.load(f)
-                sessions = data.get("sessions", [])
-        except (FileNotFoundError, json.JSONDecodeError):
-            sessions = []
+            # Only the last 10 lines are kept in memory and parsed
+            with open(self.sessions_file, 'rb') as f:
+                tail = deque((line for line in f if line.strip()), maxlen=10)
+        except FileNotFoundError:
+            tail = []
+        
+        # A crash mid-append can leave a torn line; skip it rather than lose the whole history
+        sessions = []
+        for line in tail:
+            try:
+                sessions.append(_json_loads(line))
+            except json.JSONDecodeError:
+                continue
         
         if not sessions:
             print("\n📝 No session history found.")
@@ -252,7 +454,7 @@ class SoloLevelingSystem:
         print("📊 SESSION HISTORY")
         print("="*60)
         
-        for i, session in enumerate(sessions[-10:], 1):  # Show last 10 sessions
+        for i, session in enumerate(sessions, 1):
             timestamp = datetime.fromisoformat(session["timestamp"]).strftime("%Y-%m-%d %H:%M")
             print(f"\n{i}. Session: {timestamp}")
             
@@ -1,11 +1,55 @@
+import atexit
 import sqlite3
+import sys
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 import math
-import json
 from datetime import datetime
-from typing import Dict, List, Tuple
-import os
+
+# PRAGMA user_version of a database whose timestamps are Unix epoch seconds.
+# solo_leveling.db is shared with the other front ends, which use the same number
+SCHEMA_VERSION = 1
+
+# Runtime SQL shared by every call, so each statement is built once and bound by parameter
+SQL_FIRST_RUN = (
+    'SELECT EXISTS(SELECT 1 FROM skills WHERE current_level > 1) '
+    'OR EXISTS(SELECT 1 FROM sessions)'
+)
+SQL_SELECT_SKILLS = 'SELECT attribute, skill_name, current_level FROM skills ORDER BY attribute, skill_name'
+SQL_INSERT_SESSION = '''
+    INSERT INTO sessions (session_timestamp, total_gains, session_type, notes)
+    VALUES (?, ?, ?, ?)
+'''
+SQL_UPSERT_SKILLS = '''
+    INSERT INTO skills (attribute, skill_name, current_level)
+    VALUES {values}
+    ON CONFLICT(attribute, skill_name) DO UPDATE
+    SET current_level = excluded.current_level, last_updated = CAST(strftime('%s', 'now') AS INTEGER)
+'''
+SQL_UPDATE_SKILL = '''
+    UPDATE skills 
+    SET current_level = ?, last_updated = ? 
+    WHERE attribute = ? AND skill_name = ?
+'''
+SQL_INSERT_SESSION_UPDATE = '''
+    INSERT INTO session_updates (session_id, attribute, skill_name, old_level, new_level, gain)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+SQL_INSERT_SESSION_UPDATES_BATCH = '''
+    INSERT INTO session_updates (session_id, attribute, skill_name, old_level, new_level, gain)
+    VALUES {values}
+'''
+SQL_RECENT_SESSIONS = '''
+    SELECT session_timestamp, total_gains, session_type, notes 
+    FROM sessions 
+    ORDER BY session_timestamp DESC, id DESC 
+    LIMIT 10
+'''
 
 class SoloLevelingSystem:
+    _session_type_emoji = {"crystal_ball_assessment": "🔮"}
+    
     def __init__(self):
         self.attributes = {
             "life_skills": [
@@ -35,16 +79,62 @@ class SoloLevelingSystem:
             ]
         }
         
+        # Display names are constant, so title-case them once
+        self._attr_display = {attr: attr.replace("_", " ").title() for attr in self.attributes}
+        self._skill_display = {
+            skill: skill.replace("_", " ").title()
+            for skills in self.attributes.values() for skill in skills
+        }
+        
+        # Level caps are fixed by the skill layout, so compute them once
+        self._max_per_attr = {attr: len(skills) * 100 for attr, skills in self.attributes.items()}
+        self._max_attribute_points = len(self.attributes) * 100
+        
         self.db_file = "solo_leveling.db"
+        # One long-lived connection keeps SQLite's page and statement caches warm.
+        # Autocommit mode: writes group themselves with an explicit BEGIN/commit()
+        self.conn = sqlite3.connect(self.db_file, cached_statements=256, isolation_level=None)
+        # WAL + synchronous=NORMAL stays crash-safe while avoiding an fsync per commit;
+        # journal_mode persists in the file, the rest are per-connection
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA mmap_size=67108864")
         self.init_database()
         
-        # Check if this is first run
-        self.is_first_run = self.check_first_run()
+        # Skill levels rarely change, so keep them in memory and write through on save
+        self._skills_cache = self._load_skills()
+        
+        # Rendered screens are written on a background thread so slow terminals
+        # overlap with the user reading the prompt; _wait_for_output() orders them
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stdout")
+    
+    def _write_async(self, text: str):
+        """Queue text for the background stdout writer"""
+        self._writer.submit(sys.stdout.write, text)
+    
+    def _wait_for_output(self):
+        """Block until every queued write has reached stdout"""
+        self._writer.submit(sys.stdout.flush).result()
+    
+    def close(self):
+        """Flush pending output and close the shared database connection"""
+        if self._writer is not None:
+            self._writer.shutdown(wait=True)
+            self._writer = None
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+    
+    def __del__(self):
+        conn = getattr(self, "conn", None)
+        if conn is not None:
+            conn.close()
     
     def init_database(self):
-        """Initialize SQLite database with required tables"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
+        """Initialize SQLite database with required tables and set is_first_run"""
+        cursor = self.conn.cursor()
+        cursor.execute('BEGIN')
         
         # Skills table - stores current skill levels
         cursor.execute('''
@@ -62,7 +152,7 @@ class SoloLevelingSystem:
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS sessions (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
-                session_timestamp TIMESTAMP NOT NULL,
+                session_timestamp INTEGER NOT NULL,
                 total_gains INTEGER NOT NULL DEFAULT 0,
                 session_type TEXT NOT NULL DEFAULT 'update',
                 notes TEXT
@@ -83,59 +173,82 @@ class SoloLevelingSystem:
             )
         ''')
         
+        # UNIQUE(attribute, skill_name) already covers point lookups; these back
+        # the per-attribute GROUP BY scan and session -> updates joins
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_skills_attr ON skills(attribute)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_session_updates_sid ON session_updates(session_id)')
+        
+        # Older databases store ISO-8601 text (local time, or UTC for CURRENT_TIMESTAMP
+        # defaults). Convert them to epoch seconds once, then record the schema version
+        cursor.execute('PRAGMA user_version')
+        if cursor.fetchone()[0] < SCHEMA_VERSION:
+            cursor.execute('''
+                UPDATE sessions
+                SET session_timestamp = CAST(strftime('%s', session_timestamp, 'utc') AS INTEGER)
+                WHERE typeof(session_timestamp) = 'text'
+            ''')
+            cursor.execute('''
+                UPDATE skills
+                SET last_updated = CAST(CASE WHEN instr(last_updated, 'T')
+                                             THEN strftime('%s', last_updated, 'utc')
+                                             ELSE strftime('%s', last_updated) END AS INTEGER)
+                WHERE typeof(last_updated) = 'text'
+            ''')
+            cursor.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        
         # Initialize skills if empty
         cursor.execute('SELECT COUNT(*) FROM skills')
         if cursor.fetchone()[0] == 0:
+            # Explicit epoch seconds; the column default is CURRENT_TIMESTAMP text
+            now = int(datetime.now().timestamp())
             for attribute in self.attributes:
                 for skill in self.attributes[attribute]:
                     cursor.execute('''
-                        INSERT OR IGNORE INTO skills (attribute, skill_name, current_level)
-                        VALUES (?, ?, ?)
-                    ''', (attribute, skill, 1))
-        
-        conn.commit()
-        conn.close()
-    
-    def check_first_run(self) -> bool:
-        """Check if this is the user's first time running the system"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-        
-        # Check if any skill has been updated from level 1
-        cursor.execute('SELECT COUNT(*) FROM skills WHERE current_level > 1')
-        has_progress = cursor.fetchone()[0] > 0
+                        INSERT OR IGNORE INTO skills (attribute, skill_name, current_level, last_updated)
+                        VALUES (?, ?, ?, ?)
+                    ''', (attribute, skill, 1, now))
         
-        # Check if there are any sessions
-        cursor.execute('SELECT COUNT(*) FROM sessions')
-        has_sessions = cursor.fetchone()[0] > 0
+        # First run unless a skill is above level 1 or a session exists;
+        # EXISTS stops at the first matching row instead of counting them all
+        cursor.execute(SQL_FIRST_RUN)
+        self.is_first_run = not cursor.fetchone()[0]
         
-        conn.close()
-        return not (has_progress or has_sessions)
+        self.conn.commit()
+    
+    def _prompt(self, msg: str) -> str:
+        """Write a prompt and read one line from stdin without input()'s extra flushes"""
+        self._wait_for_output()
+        sys.stdout.write(msg)
+        sys.stdout.flush()
+        return sys.stdin.readline().rstrip("\n")
     
     def crystal_ball_assessment(self):
         """🔮 ISEKAI CRYSTAL BALL STAT ASSESSMENT 🔮"""
-        print("\n" + "="*70)
-        print("🔮✨ WELCOME TO THE MYSTICAL STAT ASSESSMENT CRYSTAL ✨🔮")
-        print("="*70)
-        print("The ancient crystal ball glows with ethereal light...")
-        print("Place your hands upon it to reveal your true abilities!")
-        print("\nRate each skill from 1-100 based on your current real-life level:")
-        print("• 1-20: Complete beginner")
-        print("• 21-40: Some experience/knowledge")
-        print("• 41-60: Intermediate proficiency")
-        print("• 61-80: Advanced/Skilled")
-        print("• 81-100: Expert/Master level")
-        print("-" * 70)
+        sys.stdout.write("\n".join([
+            "\n" + "="*70,
+            "🔮✨ WELCOME TO THE MYSTICAL STAT ASSESSMENT CRYSTAL ✨🔮",
+            "="*70,
+            "The ancient crystal ball glows with ethereal light...",
+            "Place your hands upon it to reveal your true abilities!",
+            "\nRate each skill from 1-100 based on your current real-life level:",
+            "• 1-20: Complete beginner",
+            "• 21-40: Some experience/knowledge",
+            "• 41-60: Intermediate proficiency",
+            "• 61-80: Advanced/Skilled",
+            "• 81-100: Expert/Master level",
+            "-" * 70,
+        ]) + "\n")
         
         initial_assessment = {}
         session_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": int(datetime.now().timestamp()),
             "updates": {},
             "type": "crystal_ball_assessment"
         }
+        total_gains = 0
         
         for attribute_name in self.attributes:
-            attr_display = attribute_name.replace("_", " ").title()
+            attr_display = self._attr_display[attribute_name]
             print(f"\n🌟 The crystal reveals your {attr_display} abilities...")
             print("✨" * 30)
             
@@ -143,11 +256,11 @@ class SoloLevelingSystem:
             session_data["updates"][attribute_name] = {}
             
             for skill in self.attributes[attribute_name]:
-                skill_display = skill.replace("_", " ").title()
+                skill_display = self._skill_display[skill]
                 
                 while True:
                     try:
-                        level_input = input(f"🔍 {skill_display}: ").strip()
+                        level_input = self._prompt(f"🔍 {skill_display}: ").strip()
                         
                         if level_input == "":
                             level = 1  # Default to 1 if blank
@@ -170,9 +283,10 @@ class SoloLevelingSystem:
                     "new_level": level,
                     "gain": level - 1
                 }
+                total_gains += level - 1
         
         # Save to database
-        self.save_crystal_ball_assessment(initial_assessment, session_data)
+        self.save_crystal_ball_assessment(initial_assessment, session_data, total_gains)
         
         print("\n" + "🌟" * 70)
         print("✨ The crystal ball's light fades... Your stats have been revealed! ✨")
@@ -181,49 +295,76 @@ class SoloLevelingSystem:
         # Show the results dramatically
         self.display_crystal_ball_results()
     
-    def save_crystal_ball_assessment(self, assessment: dict, session_data: dict):
+    def save_crystal_ball_assessment(self, assessment: dict, session_data: dict, total_gains: int):
         """Save the initial crystal ball assessment to database"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
+        with self._write_transaction() as cursor:
+            # Create session record
+            cursor.execute(SQL_INSERT_SESSION, (
+                session_data["timestamp"], 
+                total_gains,
+                "crystal_ball_assessment",
+                "Initial stat assessment using the mystical crystal ball"
+            ))
+            
+            session_id = cursor.lastrowid
+            
+            # Update all skills and record session updates in one transaction
+            skill_rows = [
+                (attribute, skill, level)
+                for attribute, skills in assessment.items()
+                for skill, level in skills.items()
+            ]
+            insert_rows = [
+                (session_id, attribute, skill, 1, level, level - 1)
+                for attribute, skill, level in skill_rows
+            ]
+            
+            # One UPSERT with a VALUES list sets every skill in a single statement;
+            # chunk only if the row count would exceed SQLite's 999 bound parameters
+            for start in range(0, len(skill_rows), 333):
+                chunk = skill_rows[start:start + 333]
+                cursor.execute(
+                    SQL_UPSERT_SKILLS.format(values=",".join(["(?, ?, ?)"] * len(chunk))),
+                    [value for row in chunk for value in row]
+                )
+            
+            self._insert_session_updates(cursor, insert_rows)
         
-        # Create session record
-        cursor.execute('''
-            INSERT INTO sessions (session_timestamp, total_gains, session_type, notes)
-            VALUES (?, ?, ?, ?)
-        ''', (
-            session_data["timestamp"], 
-            sum(sum(skill["gain"] for skill in attr.values()) for attr in session_data["updates"].values()),
-            "crystal_ball_assessment",
-            "Initial stat assessment using the mystical crystal ball"
-        ))
-        
-        session_id = cursor.lastrowid
-        
-        # Update all skills and record session updates
-        for attribute in assessment:
-            for skill, level in assessment[attribute].items():
-                # Update current skill level
-                cursor.execute('''
-                    UPDATE skills 
-                    SET current_level = ?, last_updated = CURRENT_TIMESTAMP 
-                    WHERE attribute = ? AND skill_name = ?
-                ''', (level, attribute, skill))
-                
-                # Record session update
-                cursor.execute('''
-                    INSERT INTO session_updates (session_id, attribute, skill_name, old_level, new_level, gain)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                ''', (session_id, attribute, skill, 1, level, level - 1))
-        
-        conn.commit()
-        conn.close()
+        self._skills_cache = {attribute: dict(skills) for attribute, skills in assessment.items()}
+    
+    @contextmanager
+    def _write_transaction(self):
+        """Run a block of writes as one transaction, rolling back if any of it fails"""
+        cursor = self.conn.cursor()
+        cursor.execute('BEGIN')
+        try:
+            yield cursor
+        except BaseException:
+            # Leave the connection usable; a dangling transaction would make every later BEGIN fail
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+    
+    def _insert_session_updates(self, cursor, rows: list):
+        """Insert session_updates rows with one multi-row VALUES statement"""
+        if not rows:
+            return
+        
+        # 6 columns per row against SQLite's 999 bound-parameter limit
+        if len(rows) > 166:
+            cursor.executemany(SQL_INSERT_SESSION_UPDATE, rows)
+            return
+        
+        cursor.execute(
+            SQL_INSERT_SESSION_UPDATES_BATCH.format(values=",".join(["(?, ?, ?, ?, ?, ?)"] * len(rows))),
+            list(chain.from_iterable(rows))
+        )
     
     def display_crystal_ball_results(self):
         """Display the mystical results of the crystal ball assessment"""
         print("\n🔮 THE CRYSTAL REVEALS YOUR TRUE POWER 🔮")
-        self.display_current_stats()
-        
-        overall_level = self.calculate_overall_level()
+        overall_level = self.display_current_stats()
+        self._wait_for_output()
         print(f"\n⚡ The ancient spirits whisper... Your power level is: {overall_level}! ⚡")
         
         if overall_level < 20:
@@ -252,31 +393,43 @@ class SoloLevelingSystem:
         level = int(1 + sigmoid_value * 99)
         return min(level, 100)
     
-    def calculate_attribute_level(self, attribute: str) -> int:
+    def _attribute_sums(self) -> dict:
+        """Sum skill levels for every attribute from the in-memory skills cache"""
+        return {attr: sum(skills.values()) for attr, skills in self._skills_cache.items()}
+    
+    def calculate_attribute_level(self, attribute: str, attribute_sums: dict = None) -> int:
         """Calculate attribute level based on sum of all skills in that attribute"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT SUM(current_level) FROM skills WHERE attribute = ?', (attribute,))
-        total_skill_points = cursor.fetchone()[0] or 0
-        
-        conn.close()
+        if attribute_sums is None:
+            total_skill_points = sum(self._skills_cache.get(attribute, {}).values())
+        else:
+            total_skill_points = attribute_sums.get(attribute) or 0
         
-        max_skill_points = len(self.attributes[attribute]) * 100
-        return self.sigmoid_level_calculation(total_skill_points, max_skill_points)
+        return self.sigmoid_level_calculation(total_skill_points, self._max_per_attr[attribute])
+    
+    def _compute_levels(self) -> tuple[dict[str, int], int]:
+        """Compute every attribute level and the overall level in one pass"""
+        attribute_sums = self._attribute_sums()
+        attr_levels = {
+            attr: self.calculate_attribute_level(attr, attribute_sums) for attr in self.attributes
+        }
+        overall_level = self.sigmoid_level_calculation(
+            sum(attr_levels.values()), self._max_attribute_points
+        )
+        return attr_levels, overall_level
     
     def calculate_overall_level(self) -> int:
         """Calculate overall level based on sum of all attribute levels"""
-        total_attribute_points = sum(self.calculate_attribute_level(attr) for attr in self.attributes)
-        max_attribute_points = len(self.attributes) * 100
-        return self.sigmoid_level_calculation(total_attribute_points, max_attribute_points)
+        return self._compute_levels()[1]
     
     def get_current_skills(self) -> dict:
-        """Get current skill levels from database"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
+        """Get current skill levels (served from the in-memory cache)"""
+        return self._skills_cache
+    
+    def _load_skills(self) -> dict:
+        """Read current skill levels from database"""
+        cursor = self.conn.cursor()
         
-        cursor.execute('SELECT attribute, skill_name, current_level FROM skills ORDER BY attribute, skill_name')
+        cursor.execute(SQL_SELECT_SKILLS)
         rows = cursor.fetchall()
         
         skills = {}
@@ -285,31 +438,35 @@ class SoloLevelingSystem:
                 skills[attribute] = {}
             skills[attribute][skill_name] = level
         
-        conn.close()
         return skills
     
-    def display_current_stats(self):
-        """Display current player statistics"""
-        print("\n" + "="*60)
-        print("🎮 SOLO LEVELING SYSTEM - CURRENT STATS 🎮")
-        print("="*60)
-        
-        overall_level = self.calculate_overall_level()
-        print(f"🏆 OVERALL LEVEL: {overall_level}/100")
-        print("-"*60)
-        
+    def display_current_stats(self) -> int:
+        """Display current player statistics and return the overall level"""
+        attr_levels, overall_level = self._compute_levels()
         skills = self.get_current_skills()
         
+        # Build the whole screen first and write it in one call
+        lines = [
+            "\n" + "="*60,
+            "🎮 SOLO LEVELING SYSTEM - CURRENT STATS 🎮",
+            "="*60,
+            f"🏆 OVERALL LEVEL: {overall_level}/100",
+            "-"*60,
+        ]
+        
         for attribute_name in self.attributes:
-            attr_level = self.calculate_attribute_level(attribute_name)
-            attr_display = attribute_name.replace("_", " ").title()
-            print(f"\n📊 {attr_display} - Level {attr_level}/100:")
+            attr_level = attr_levels[attribute_name]
+            attr_display = self._attr_display[attribute_name]
+            lines.append(f"\n📊 {attr_display} - Level {attr_level}/100:")
             
             if attribute_name in skills:
                 for skill in self.attributes[attribute_name]:
-                    skill_display = skill.replace("_", " ").title()
+                    skill_display = self._skill_display[skill]
                     skill_level = skills[attribute_name].get(skill, 1)
-                    print(f"   • {skill_display}: {skill_level}/100")
+                    lines.append(f"   • {skill_display}: {skill_level}/100")
+        
+        self._write_async("\n".join(lines) + "\n")
+        return overall_level
     
     def update_skills_session(self):
         """Interactive session to update skill levels"""
@@ -321,18 +478,18 @@ class SoloLevelingSystem:
         
         # Allow custom timestamp
         print("\nWould you like to set a custom date for this session?")
-        custom_date = input("Enter date (YYYY-MM-DD) or press Enter for now: ").strip()
+        custom_date = self._prompt("Enter date (YYYY-MM-DD) or press Enter for now: ").strip()
         
         if custom_date:
             try:
                 # Validate date format
-                datetime.strptime(custom_date, "%Y-%m-%d")
-                session_timestamp = f"{custom_date}T{datetime.now().strftime('%H:%M:%S')}"
+                session_date = datetime.strptime(custom_date, "%Y-%m-%d")
+                session_timestamp = int(datetime.combine(session_date.date(), datetime.now().time()).timestamp())
             except ValueError:
                 print("Invalid date format, using current timestamp.")
-                session_timestamp = datetime.now().isoformat()
+                session_timestamp = int(datetime.now().timestamp())
         else:
-            session_timestamp = datetime.now().isoformat()
+            session_timestamp = int(datetime.now().timestamp())
         
         session_updates = []
         total_gains = 0
@@ -340,17 +497,17 @@ class SoloLevelingSystem:
         current_skills = self.get_current_skills()
         
         for attribute_name in self.attributes:
-            attr_display = attribute_name.replace("_", " ").title()
+            attr_display = self._attr_display[attribute_name]
             print(f"\n🎯 UPDATING: {attr_display}")
             print("-" * 30)
             
             for skill in self.attributes[attribute_name]:
-                skill_display = skill.replace("_", " ").title()
+                skill_display = self._skill_display[skill]
                 current_level = current_skills.get(attribute_name, {}).get(skill, 1)
                 
                 while True:
                     try:
-                        user_input = input(f"{skill_display} [{current_level}] → ").strip()
+                        user_input = self._prompt(f"{skill_display} [{current_level}] → ").strip()
                         
                         if user_input == "":
                             new_level = current_level
@@ -393,72 +550,53 @@ class SoloLevelingSystem:
         else:
             print("\n📝 No changes made this session.")
     
-    def save_update_session(self, timestamp: str, updates: list, total_gains: int):
+    def save_update_session(self, timestamp: int, updates: list, total_gains: int):
         """Save update session to database"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-        
-        # Create session record
-        cursor.execute('''
-            INSERT INTO sessions (session_timestamp, total_gains, session_type)
-            VALUES (?, ?, ?)
-        ''', (timestamp, total_gains, "skill_update"))
-        
-        session_id = cursor.lastrowid
-        
-        # Update skills and record session updates
-        for update in updates:
-            # Update current skill level
-            cursor.execute('''
-                UPDATE skills 
-                SET current_level = ?, last_updated = ? 
-                WHERE attribute = ? AND skill_name = ?
-            ''', (update['new_level'], timestamp, update['attribute'], update['skill']))
+        with self._write_transaction() as cursor:
+            # Create session record
+            cursor.execute(SQL_INSERT_SESSION, (timestamp, total_gains, "skill_update", None))
             
-            # Record session update
-            cursor.execute('''
-                INSERT INTO session_updates (session_id, attribute, skill_name, old_level, new_level, gain)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (session_id, update['attribute'], update['skill'], 
-                  update['old_level'], update['new_level'], update['gain']))
+            session_id = cursor.lastrowid
+            
+            # Update skills and record session updates in one transaction
+            cursor.executemany(SQL_UPDATE_SKILL, [
+                (update['new_level'], timestamp, update['attribute'], update['skill'])
+                for update in updates
+            ])
+            
+            self._insert_session_updates(cursor, [
+                (session_id, update['attribute'], update['skill'],
+                 update['old_level'], update['new_level'], update['gain'])
+                for update in updates
+            ])
         
-        conn.commit()
-        conn.close()
+        for update in updates:
+            self._skills_cache[update['attribute']][update['skill']] = update['new_level']
     
     def view_history(self):
         """View session history from database"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT session_timestamp, total_gains, session_type, notes 
-            FROM sessions 
-            ORDER BY session_timestamp DESC 
-            LIMIT 10
-        ''')
-        
-        sessions = cursor.fetchall()
+        # Iterate the cursor directly so rows are formatted as SQLite yields them
+        lines = [
+            "\n" + "="*60,
+            "📊 SESSION HISTORY (Last 10 Sessions)",
+            "="*60,
+        ]
+        
+        for i, (timestamp, gains, session_type, notes) in enumerate(self.conn.execute(SQL_RECENT_SESSIONS), 1):
+            date_str = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M")
+            type_emoji = self._session_type_emoji.get(session_type, "📈")
+            
+            lines.append(f"\n{i}. {type_emoji} {date_str}")
+            lines.append(f"   Type: {session_type.replace('_', ' ').title()}")
+            lines.append(f"   Total gains: +{gains} levels")
+            if notes:
+                lines.append(f"   Notes: {notes}")
         
-        if not sessions:
+        if len(lines) == 3:  # header only, no rows
             print("\n📝 No session history found.")
-            conn.close()
             return
         
-        print("\n" + "="*60)
-        print("📊 SESSION HISTORY (Last 10 Sessions)")
-        print("="*60)
-        
-        for i, (timestamp, gains, session_type, notes) in enumerate(sessions, 1):
-            date_str = datetime.fromisoformat(timestamp).strftime("%Y-%m-%d %H:%M")
-            type_emoji = "🔮" if session_type == "crystal_ball_assessment" else "📈"
-            
-            print(f"\n{i}. {type_emoji} {date_str}")
-            print(f"   Type: {session_type.replace('_', ' ').title()}")
-            print(f"   Total gains: +{gains} levels")
-            if notes:
-                print(f"   Notes: {notes}")
-        
-        conn.close()
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def main_menu(self):
         """Main menu loop"""
@@ -473,15 +611,21 @@ class SoloLevelingSystem:
                 self.crystal_ball_assessment()
                 self.is_first_run = False
         
+        menu = "\n".join([
+            "\n" + "="*50,
+            "🎮 SOLO LEVELING SYSTEM V2",
+            "="*50,
+            "1. 🔮 Crystal Ball Assessment (Initial Stats)",
+            "2. 📊 View Current Stats",
+            "3. 📈 Update Skills",
+            "4. 📚 View History",
+            "5. 🚪 Exit",
+        ]) + "\n"
+        
         while True:
-            print("\n" + "="*50)
-            print("🎮 SOLO LEVELING SYSTEM V2")
-            print("="*50)
-            print("1. 🔮 Crystal Ball Assessment (Initial Stats)")
-            print("2. 📊 View Current Stats")
-            print("3. 📈 Update Skills")
-            print("4. 📚 View History")
-            print("5. 🚪 Exit")
+            # Queue the menu behind any screen still being written, then wait once
+            self._write_async(menu)
+            self._wait_for_output()
             
             choice = input("\nChoose an option (1-5): ").strip()
             
@@ -507,6 +651,7 @@ def main():
     print("🚀 Initializing Solo Leveling System V2...")
     print("🔄 Setting up database...")
     system = SoloLevelingSystem()
+    atexit.register(system.close)
     system.main_menu()
 
 if __name__ == "__main__":
@@ -1,20 +1,88 @@
+import atexit
 import sqlite3
+from contextlib import contextmanager
 import math
 import json
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-import seaborn as sns
 from datetime import datetime, timedelta
-import pandas as pd
 import numpy as np
 
-# Set style for better looking plots
-plt.style.use('default')
-sns.set_palette("husl")
+# Plotting modules are imported on first use by SoloLevelingGUI._load_plotting
+plt = None
+mdates = None
+pd = None
+
+def min_max_decimate(x: np.ndarray, y: np.ndarray, target_px: int):
+    """Reduce a series to the min and max point of each pixel-wide bucket"""
+    n = len(y)
+    if n <= 2 * target_px:
+        return x, y
+    
+    x = np.asarray(x)
+    y = np.asarray(y)
+    bucket = n // target_px
+    usable = bucket * target_px
+    xs = x[:usable].reshape(target_px, bucket)
+    ys = y[:usable].reshape(target_px, bucket)
+    
+    # Keep both extremes of every bucket in their original x order
+    rows = np.arange(target_px)
+    i_min = ys.argmin(axis=1)
+    i_max = ys.argmax(axis=1)
+    first = np.minimum(i_min, i_max)
+    second = np.maximum(i_min, i_max)
+    
+    x_out = np.column_stack([xs[rows, first], xs[rows, second]]).ravel()
+    y_out = np.column_stack([ys[rows, first], ys[rows, second]]).ravel()
+    return np.concatenate([x_out, x[usable:]]), np.concatenate([y_out, y[usable:]])
+
+# Schema revision recorded in PRAGMA user_version; 1 = timestamps are epoch seconds
+SCHEMA_VERSION = 1
+
+SQL_INSERT_SESSION_UPDATE = (
+    'INSERT INTO session_updates (session_id, attribute, skill_name, old_level, new_level, gain) '
+    'VALUES (?, ?, ?, ?, ?, ?)'
+)
+
+SQL_SELECT_SESSIONS = (
+    'SELECT session_timestamp, session_type, total_gains, notes, '
+    'SUM(total_gains) OVER (ORDER BY session_timestamp, id), id, '
+    "strftime('%Y-%m-%d %H:%M', session_timestamp, 'unixepoch', 'localtime') "
+    'FROM sessions ORDER BY session_timestamp, id'
+)
+
+SQL_UPDATE_SKILL = 'UPDATE skills SET current_level = ?, last_updated = ? WHERE id = ?'
+
+# Below this many rows a plain executemany is as cheap as building the CASE statement
+BULK_UPDATE_MIN_ROWS = 8
+
+def _sigmoid_levels_loop(totals, maxes):
+    """Scalar sigmoid level loop; compiled by Numba when it is available"""
+    levels = np.empty(totals.shape[0], dtype=np.int64)
+    for i in range(totals.shape[0]):
+        if totals[i] <= 0:
+            levels[i] = 1
+            continue
+        x = totals[i] / maxes[i]
+        level = int(1 + 99 / (1 + math.exp(-10 * (x - 0.5))))
+        levels[i] = min(level, 100)
+    return levels
+
+_sigmoid_kernel = None  # Set by _warm_sigmoid_kernel; sigmoid_levels uses NumPy until then
+
+def _warm_sigmoid_kernel():
+    """Import Numba and compile the sigmoid loop (a no-op when Numba is not installed)"""
+    global _sigmoid_kernel
+    if _sigmoid_kernel is not None:
+        return
+    try:
+        from numba import njit
+    except ImportError:
+        return
+    kernel = njit(cache=True)(_sigmoid_levels_loop)
+    kernel(np.zeros(1), np.ones(1))  # Compile the float64 signature now, not on the next refresh
+    _sigmoid_kernel = kernel
 
 class SoloLevelingGUI:
     def __init__(self):
@@ -56,9 +124,27 @@ class SoloLevelingGUI:
             ]
         }
         
+        # Display names are constant, so title-case them once
+        self._attr_display = {attr: attr.replace("_", " ").title() for attr in self.attributes}
+        self._skill_display = {
+            skill: skill.replace("_", " ").title()
+            for skills in self.attributes.values() for skill in skills
+        }
+        self._session_type_display = {}  # Filled as session types are first seen
+        
         self.db_file = "solo_leveling.db"
+        # One long-lived connection for the GUI thread; writes use explicit BEGIN/commit()
+        self.conn = sqlite3.connect(self.db_file, isolation_level=None, check_same_thread=False)
         self.init_database()
         
+        # Skill rows never change identity, so writers can address them by primary key
+        cursor = self.conn.cursor()
+        cursor.execute('SELECT id, attribute, skill_name FROM skills')
+        self._skill_id = {(attribute, skill): skill_id for skill_id, attribute, skill in cursor.fetchall()}
+        self._skills_cache = None
+        self._sessions_cache = None
+        self._levels_cache = None
+        
         # Initialize GUI
         self.root = tk.Tk()
         self.root.title("🎮 Solo Leveling System V3 🎮")
@@ -70,14 +156,34 @@ class SoloLevelingGUI:
         
         self.setup_gui()
         
+        # Importing and compiling Numba takes seconds; the first window is drawn with the
+        # NumPy path and the kernel is built once Tk is idle
+        self.root.after_idle(_warm_sigmoid_kernel)
+        
         # Handle first run
         if self.is_first_run:
             self.root.after(1000, self.show_crystal_ball_welcome)  # Delay to let GUI load
     
+    def close(self):
+        """Close the shared database connection"""
+        if self.conn is not None:
+            # Refresh planner statistics for the indexes this session actually used
+            self.conn.execute("PRAGMA optimize")
+            self.conn.close()
+            self.conn = None
+    
     def init_database(self):
         """Initialize SQLite database with required tables"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
+        
+        # Connection tuning must happen outside a transaction; WAL persists in the file.
+        # synchronous=NORMAL under WAL never corrupts the database and survives an app
+        # crash, but a power loss can drop the last few commits - fine for a personal tracker
+        for pragma in ("journal_mode=WAL", "synchronous=NORMAL", "temp_store=MEMORY",
+                       "mmap_size=268435456", "cache_size=-20000"):
+            cursor.execute(f"PRAGMA {pragma}")
+        
+        cursor.execute('BEGIN')
         
         # Skills table
         cursor.execute('''
@@ -116,23 +222,82 @@ class SoloLevelingGUI:
             )
         ''')
         
+        # Per-attribute skill sums, kept current by triggers on skills so level
+        # reads touch one row per attribute instead of scanning every skill
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS attribute_totals (
+                attribute TEXT PRIMARY KEY,
+                total INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_skill_ins AFTER INSERT ON skills
+            BEGIN
+                INSERT INTO attribute_totals (attribute, total) VALUES (NEW.attribute, NEW.current_level)
+                ON CONFLICT(attribute) DO UPDATE SET total = total + excluded.total;
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_skill_upd AFTER UPDATE OF attribute, current_level ON skills
+            BEGIN
+                UPDATE attribute_totals SET total = total - OLD.current_level WHERE attribute = OLD.attribute;
+                UPDATE attribute_totals SET total = total + NEW.current_level WHERE attribute = NEW.attribute;
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_skill_del AFTER DELETE ON skills
+            BEGIN
+                UPDATE attribute_totals SET total = total - OLD.current_level WHERE attribute = OLD.attribute;
+            END
+        ''')
+        
+        # Resync once per startup in case skills was written before the triggers existed
+        cursor.execute('DELETE FROM attribute_totals')
+        cursor.execute('''
+            INSERT INTO attribute_totals (attribute, total)
+            SELECT attribute, SUM(current_level) FROM skills GROUP BY attribute
+        ''')
+        
+        # Keeps the sessions ORDER BY (and its running total) index-ordered
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_sessions_ts ON sessions(session_timestamp)')
+        # Covers the full skills read so it never touches the table itself
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_skills_attr_skill_level
+            ON skills(attribute, skill_name, current_level)
+        ''')
+        
+        # Timestamps used to be ISO-8601 text; convert them to Unix epoch seconds once.
+        # Our own ISO strings are local time, CURRENT_TIMESTAMP defaults are UTC
+        cursor.execute('PRAGMA user_version')
+        if cursor.fetchone()[0] < SCHEMA_VERSION:
+            cursor.execute('''
+                UPDATE sessions
+                SET session_timestamp = CAST(strftime('%s', session_timestamp, 'utc') AS INTEGER)
+                WHERE typeof(session_timestamp) = 'text'
+            ''')
+            cursor.execute('''
+                UPDATE skills
+                SET last_updated = CAST(CASE WHEN instr(last_updated, 'T')
+                                             THEN strftime('%s', last_updated, 'utc')
+                                             ELSE strftime('%s', last_updated) END AS INTEGER)
+                WHERE typeof(last_updated) = 'text'
+            ''')
+            cursor.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        
         # Initialize skills if empty
         cursor.execute('SELECT COUNT(*) FROM skills')
         if cursor.fetchone()[0] == 0:
-            for attribute in self.attributes:
-                for skill in self.attributes[attribute]:
-                    cursor.execute('''
-                        INSERT OR IGNORE INTO skills (attribute, skill_name, current_level)
-                        VALUES (?, ?, ?)
-                    ''', (attribute, skill, 1))
+            now = int(datetime.now().timestamp())
+            cursor.executemany('''
+                INSERT OR IGNORE INTO skills (attribute, skill_name, current_level, last_updated)
+                VALUES (?, ?, ?, ?)
+            ''', [(attribute, skill, 1, now) for attribute, skills in self.attributes.items() for skill in skills])
         
-        conn.commit()
-        conn.close()
+        self.conn.commit()
     
     def check_first_run(self) -> bool:
         """Check if this is the user's first time running the system"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
         
         cursor.execute('SELECT COUNT(*) FROM skills WHERE current_level > 1')
         has_progress = cursor.fetchone()[0] > 0
@@ -140,7 +305,6 @@ class SoloLevelingGUI:
         cursor.execute('SELECT COUNT(*) FROM sessions')
         has_sessions = cursor.fetchone()[0] > 0
         
-        conn.close()
         return not (has_progress or has_sessions)
     
     def sigmoid_level_calculation(self, total_points: int, max_points: int) -> int:
@@ -153,29 +317,64 @@ class SoloLevelingGUI:
         level = int(1 + sigmoid_value * 99)
         return min(level, 100)
     
-    def calculate_attribute_level(self, attribute: str) -> int:
+    def sigmoid_levels(self, totals: np.ndarray, maxes: np.ndarray) -> np.ndarray:
+        """Vectorized sigmoid_level_calculation over arrays of totals and maxima"""
+        totals = np.asarray(totals, dtype=np.float64)
+        if _sigmoid_kernel is not None:
+            return _sigmoid_kernel(totals, np.asarray(maxes, dtype=np.float64))
+        
+        x = totals / maxes
+        levels = (1 + 99 / (1 + np.exp(-10 * (x - 0.5)))).astype(int)
+        levels = np.clip(levels, 1, 100)
+        return np.where(totals <= 0, 1, levels)
+    
+    def _attribute_sums(self) -> dict:
+        """Skill level sums for every attribute from the trigger-maintained totals"""
+        cursor = self.conn.cursor()
+        cursor.execute('SELECT attribute, total FROM attribute_totals')
+        return dict(cursor.fetchall())
+    
+    def calculate_attribute_level(self, attribute: str, attribute_sums: dict = None) -> int:
         """Calculate attribute level based on sum of all skills"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT SUM(current_level) FROM skills WHERE attribute = ?', (attribute,))
-        total_skill_points = cursor.fetchone()[0] or 0
-        
-        conn.close()
+        if attribute_sums is None:
+            cursor = self.conn.cursor()
+            cursor.execute('SELECT total FROM attribute_totals WHERE attribute = ?', (attribute,))
+            row = cursor.fetchone()
+            total_skill_points = row[0] if row else 0
+        else:
+            total_skill_points = attribute_sums.get(attribute) or 0
         
         max_skill_points = len(self.attributes[attribute]) * 100
         return self.sigmoid_level_calculation(total_skill_points, max_skill_points)
     
+    def overall_and_per_attribute(self) -> tuple[int, dict[str, int]]:
+        """Overall level (out of 500) and every attribute level, cached until the next write"""
+        if self._levels_cache is None:
+            attribute_sums = self._attribute_sums()
+            levels = self.sigmoid_levels(
+                np.array([attribute_sums.get(attr) or 0 for attr in self.attributes]),
+                np.array([len(self.attributes[attr]) * 100 for attr in self.attributes])
+            )
+            self._levels_cache = (int(levels.sum()), dict(zip(self.attributes, levels.tolist())))
+        return self._levels_cache
+    
+    def _attribute_levels(self) -> dict:
+        """Level of every attribute as {attribute: level}"""
+        return self.overall_and_per_attribute()[1]
+    
     def calculate_overall_level(self) -> int:
         """Calculate overall level based on sum of all attribute levels (out of 500)"""
-        total_attribute_points = sum(self.calculate_attribute_level(attr) for attr in self.attributes)
-        max_attribute_points = len(self.attributes) * 100  # 5 attributes × 100 = 500
-        return total_attribute_points  # Return raw sum for display as X/500
+        return self.overall_and_per_attribute()[0]  # Raw sum for display as X/500
     
     def get_current_skills(self) -> dict:
-        """Get current skill levels from database"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
+        """Get current skill levels, cached until the next write"""
+        if self._skills_cache is None:
+            self._skills_cache = self._fetch_all_skills()
+        return self._skills_cache
+    
+    def _fetch_all_skills(self) -> dict:
+        """Read every skill level in one query as {attribute: {skill: level}}"""
+        cursor = self.conn.cursor()
         
         cursor.execute('SELECT attribute, skill_name, current_level FROM skills ORDER BY attribute, skill_name')
         rows = cursor.fetchall()
@@ -186,9 +385,14 @@ class SoloLevelingGUI:
                 skills[attribute] = {}
             skills[attribute][skill_name] = level
         
-        conn.close()
         return skills
     
+    def get_sessions(self) -> list:
+        """Get all sessions oldest first, cached until the next write"""
+        if self._sessions_cache is None:
+            self._sessions_cache = self.conn.execute(SQL_SELECT_SESSIONS).fetchall()
+        return self._sessions_cache
+    
     def setup_gui(self):
         """Setup the main GUI interface"""
         # Create main frame
@@ -221,6 +425,10 @@ class SoloLevelingGUI:
         self.setup_progress_tab()
         self.setup_history_tab()
         
+        # Tabs marked stale by a refresh are redrawn when they are next shown
+        self._stale_tabs = set()
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+        
         # Button frame
         button_frame = tk.Frame(main_frame, bg='#2c3e50')
         button_frame.pack(fill=tk.X, pady=(10, 0))
@@ -239,29 +447,51 @@ class SoloLevelingGUI:
                                   relief=tk.RAISED, bd=3)
         refresh_button.pack(side=tk.LEFT)
     
-    def setup_stats_tab(self):
-        """Setup the current stats tab"""
-        stats_frame = ttk.Frame(self.notebook)
-        self.notebook.add(stats_frame, text="📊 Current Stats")
-        
-        # Create canvas and scrollbar for stats
-        canvas = tk.Canvas(stats_frame, bg='#ecf0f1')
-        scrollbar = ttk.Scrollbar(stats_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg='#ecf0f1')
+    def _make_scrollable(self, parent, bg: str):
+        """Create a vertically scrollable canvas in parent and return (canvas, inner frame)"""
+        canvas = tk.Canvas(parent, bg=bg)
+        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
+        scrollable_frame = tk.Frame(canvas, bg=bg)
         
+        # Bind this canvas as a default argument so each tab scrolls its own region
         scrollable_frame.bind(
             "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            lambda e, c=canvas: c.configure(scrollregion=c.bbox("all"))
         )
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
-        # Pack canvas and scrollbar
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
-        self.stats_content_frame = scrollable_frame
+        return canvas, scrollable_frame
+    
+    def setup_stats_tab(self):
+        """Setup the current stats tab"""
+        stats_frame = ttk.Frame(self.notebook)
+        self._stats_frame = stats_frame
+        self.notebook.add(stats_frame, text="📊 Current Stats")
+        
+        # One Treeview renders every attribute and skill instead of a Label per skill
+        style = ttk.Style()
+        style.configure('Stats.Treeview', font=('Arial', 10), rowheight=24,
+                        background='#34495e', fieldbackground='#34495e', foreground='#ecf0f1')
+        
+        self.stats_tree = ttk.Treeview(stats_frame, columns=('Skill', 'Level'),
+                                       show='tree', style='Stats.Treeview')
+        self.stats_tree.column('#0', width=320)
+        self.stats_tree.column('Skill', width=260)
+        self.stats_tree.column('Level', width=80, anchor='e')
+        self.stats_tree.tag_configure('attribute', font=('Arial', 14, 'bold'), foreground='#f39c12')
+        
+        scrollbar = ttk.Scrollbar(stats_frame, orient="vertical", command=self.stats_tree.yview)
+        self.stats_tree.configure(yscrollcommand=scrollbar.set)
+        
+        self.stats_tree.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        
+        self._stats_items = {}
         self.refresh_stats_display()
     
     def setup_update_tab(self):
@@ -294,38 +524,28 @@ class SoloLevelingGUI:
         attr_notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         self.update_entries = {}
+        self._entry_order = {}
+        self._dirty = set()  # (attribute, skill) keys whose entry text has changed
+        all_skills = self.get_current_skills()
         
         for attribute in self.attributes:
             # Create frame for this attribute
             attr_frame = ttk.Frame(attr_notebook)
-            attr_name_display = attribute.replace("_", " ").title()
+            attr_name_display = self._attr_display[attribute]
             attr_notebook.add(attr_frame, text=attr_name_display)
             
             # Create scrollable frame
-            canvas = tk.Canvas(attr_frame, bg='#ecf0f1')
-            scrollbar = ttk.Scrollbar(attr_frame, orient="vertical", command=canvas.yview)
-            scrollable_frame = tk.Frame(canvas, bg='#ecf0f1')
-            
-            scrollable_frame.bind(
-                "<Configure>",
-                lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-            )
-            
-            canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-            canvas.configure(yscrollcommand=scrollbar.set)
-            
-            canvas.pack(side="left", fill="both", expand=True)
-            scrollbar.pack(side="right", fill="y")
+            canvas, scrollable_frame = self._make_scrollable(attr_frame, '#ecf0f1')
             
             # Add skills to this attribute
             self.update_entries[attribute] = {}
-            skills = self.get_current_skills().get(attribute, {})
+            skills = all_skills.get(attribute, {})
             
             for i, skill in enumerate(self.attributes[attribute]):
                 skill_frame = tk.Frame(scrollable_frame, bg='#ecf0f1')
                 skill_frame.pack(fill=tk.X, padx=10, pady=5)
                 
-                skill_display = skill.replace("_", " ").title()
+                skill_display = self._skill_display[skill]
                 current_level = skills.get(skill, 1)
                 
                 # Skill label
@@ -342,12 +562,16 @@ class SoloLevelingGUI:
                 entry_var = tk.StringVar()
                 entry = tk.Entry(skill_frame, textvariable=entry_var, width=5)
                 entry.pack(side=tk.LEFT, padx=5)
+                # A variable trace also sees pasted and programmatic edits, unlike key events
+                entry_var.trace_add('write', lambda *args, k=(attribute, skill): self._dirty.add(k))
                 
                 self.update_entries[attribute][skill] = {
                     'var': entry_var,
+                    'entry': entry,
                     'current': current_level,
                     'label': current_label
                 }
+                self._entry_order[(attribute, skill)] = len(self._entry_order)
         
         # Update button
         update_button = tk.Button(parent, text="💾 Save Updates", 
@@ -361,10 +585,13 @@ class SoloLevelingGUI:
         progress_frame = ttk.Frame(self.notebook)
         self.notebook.add(progress_frame, text="📈 Progress Charts")
         
-        # Create matplotlib figure
-        self.fig = Figure(figsize=(12, 8), dpi=100, facecolor='#ecf0f1')
-        self.canvas = FigureCanvasTkAgg(self.fig, progress_frame)
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        # The matplotlib figure is created inside this holder when the tab is first opened
+        self._plt_loaded = False
+        self._progress_frame = progress_frame
+        self._chart_holder = tk.Frame(progress_frame, bg='#ecf0f1')
+        self._chart_holder.pack(fill=tk.BOTH, expand=True)
+        self._chart = None  # Artists of the chart on screen, reused while its kind stays shown
+        self._chart_shown = self.show_attribute_chart  # Last chart selected; refreshes redraw it
         
         # Chart selection buttons
         chart_frame = tk.Frame(progress_frame, bg='#ecf0f1')
@@ -382,12 +609,85 @@ class SoloLevelingGUI:
                  command=self.show_skill_heatmap,
                  bg='#e74c3c', fg='white').pack(side=tk.LEFT, padx=5)
         
-        # Show initial chart
-        self.show_attribute_chart()
+        # The initial chart is drawn by _on_tab_changed once the tab is opened
+    
+    def _on_tab_changed(self, event=None):
+        """Bring the newly selected tab up to date (first chart, or a stale refresh)"""
+        if not self._plt_loaded and self._current_tab() == 'chart':
+            self._stale_tabs.discard('chart')
+            self.show_attribute_chart()
+            return
+        self._refresh_visible_tab()
+    
+    def _current_tab(self):
+        """Key of the selected notebook tab: 'stats', 'chart', 'history' or None"""
+        current = self.notebook.index('current')
+        for key, frame in (('stats', self._stats_frame), ('chart', self._progress_frame),
+                           ('history', self._history_frame)):
+            if current == self.notebook.index(frame):
+                return key
+        return None
+    
+    def _refresh_visible_tab(self):
+        """Redraw the selected tab if a refresh left it stale"""
+        key = self._current_tab()
+        if key not in self._stale_tabs:
+            return
+        self._stale_tabs.discard(key)
+        if key == 'stats':
+            self.refresh_stats_display()
+        elif key == 'history':
+            self.refresh_history_display()
+        elif self._plt_loaded:
+            # Same chart as before, so its in-place update path runs
+            self._chart_shown()
+    
+    def _load_plotting(self):
+        """Import matplotlib/seaborn and build the chart canvas on first use"""
+        if self._plt_loaded:
+            return
+        
+        global plt, mdates, pd
+        import matplotlib.pyplot as plt
+        import matplotlib.dates as mdates
+        import pandas as pd
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+        import seaborn as sns
+        
+        # Set style for better looking plots
+        plt.style.use('default')
+        sns.set_palette("husl")
+        
+        # Create matplotlib figure
+        self.fig = Figure(figsize=(12, 8), dpi=100, facecolor='#ecf0f1')
+        self.canvas = FigureCanvasTkAgg(self.fig, self._chart_holder)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
+        self._plt_loaded = True
+    
+    def _on_canvas_draw(self, event):
+        """Re-capture the blit background after any full redraw (first draw, resize)"""
+        chart = self._chart
+        if chart is None or 'animated' not in chart:
+            return
+        # Full draws skip animated artists, so save the static background and paint them on top
+        chart['background'] = self.canvas.copy_from_bbox(self.fig.bbox)
+        for artist in chart['animated']:
+            self.fig.draw_artist(artist)
+    
+    def _blit_chart(self):
+        """Repaint only the animated artists of the chart on screen over its saved background"""
+        chart = self._chart
+        self.canvas.restore_region(chart['background'])
+        for artist in chart['animated']:
+            self.fig.draw_artist(artist)
+        self.canvas.blit(self.fig.bbox)
     
     def setup_history_tab(self):
         """Setup the session history tab"""
         history_frame = ttk.Frame(self.notebook)
+        self._history_frame = history_frame
         self.notebook.add(history_frame, text="📚 Session History")
         
         # Create treeview for session history
@@ -406,6 +706,7 @@ class SoloLevelingGUI:
         
         # Pack treeview and scrollbars
         self.history_tree.pack(side="left", fill="both", expand=True)
+        self._history_iids = []  # Session rows currently in the tree, newest first
         v_scrollbar.pack(side="right", fill="y")
         h_scrollbar.pack(side="bottom", fill="x")
         
@@ -427,6 +728,13 @@ class SoloLevelingGUI:
     
     def show_crystal_ball_dialog(self):
         """Show crystal ball assessment dialog"""
+        # Reuse the dialog built on a previous open instead of recreating every widget
+        if getattr(self, '_crystal_win', None) and self._crystal_win.winfo_exists():
+            self._reset_crystal_entries()
+            self._crystal_win.deiconify()
+            self._crystal_win.grab_set()
+            return
+        
         crystal_window = tk.Toplevel(self.root)
         crystal_window.title("🔮 Crystal Ball Assessment 🔮")
         crystal_window.geometry("800x600")
@@ -460,24 +768,11 @@ class SoloLevelingGUI:
         
         for attribute in self.attributes:
             attr_frame = ttk.Frame(crystal_notebook)
-            attr_name_display = attribute.replace("_", " ").title()
+            attr_name_display = self._attr_display[attribute]
             crystal_notebook.add(attr_frame, text=attr_name_display)
             
             # Create scrollable frame
-            canvas = tk.Canvas(attr_frame, bg='#34495e')
-            scrollbar = ttk.Scrollbar(attr_frame, orient="vertical", command=canvas.yview)
-            scrollable_frame = tk.Frame(canvas, bg='#34495e')
-            
-            scrollable_frame.bind(
-                "<Configure>",
-                lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-            )
-            
-            canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-            canvas.configure(yscrollcommand=scrollbar.set)
-            
-            canvas.pack(side="left", fill="both", expand=True)
-            scrollbar.pack(side="right", fill="y")
+            canvas, scrollable_frame = self._make_scrollable(attr_frame, '#34495e')
             
             crystal_entries[attribute] = {}
             
@@ -485,7 +780,7 @@ class SoloLevelingGUI:
                 skill_frame = tk.Frame(scrollable_frame, bg='#34495e')
                 skill_frame.pack(fill=tk.X, padx=10, pady=5)
                 
-                skill_display = skill.replace("_", " ").title()
+                skill_display = self._skill_display[skill]
                 
                 label = tk.Label(skill_frame, text=f"🔍 {skill_display}:", 
                                font=('Arial', 10), fg='#ecf0f1', bg='#34495e', 
@@ -499,6 +794,15 @@ class SoloLevelingGUI:
                 
                 crystal_entries[attribute][skill] = entry_var
         
+        self._crystal_win = crystal_window
+        self._crystal_entries = crystal_entries
+        
+        def hide_crystal_window():
+            crystal_window.grab_release()
+            crystal_window.withdraw()
+        
+        crystal_window.protocol("WM_DELETE_WINDOW", hide_crystal_window)
+        
         # Buttons
         button_frame = tk.Frame(crystal_window, bg='#2c3e50')
         button_frame.pack(fill=tk.X, pady=10)
@@ -506,7 +810,7 @@ class SoloLevelingGUI:
         def save_crystal_assessment():
             try:
                 self.process_crystal_ball_assessment(crystal_entries)
-                crystal_window.destroy()
+                hide_crystal_window()
                 messagebox.showinfo("✨ Assessment Complete!", 
                                    "The crystal has revealed your true power!\n"
                                    "Your stats have been updated.")
@@ -520,94 +824,127 @@ class SoloLevelingGUI:
                  relief=tk.RAISED, bd=3).pack(side=tk.LEFT, padx=10)
         
         tk.Button(button_frame, text="❌ Cancel", 
-                 command=crystal_window.destroy,
+                 command=hide_crystal_window,
                  font=('Arial', 12), bg='#e74c3c', fg='white',
                  relief=tk.RAISED, bd=3).pack(side=tk.LEFT)
     
+    def _reset_crystal_entries(self):
+        """Put every crystal ball entry back to its starting value"""
+        for skills in self._crystal_entries.values():
+            for entry_var in skills.values():
+                entry_var.set("1")
+    
     def process_crystal_ball_assessment(self, entries: dict):
         """Process crystal ball assessment results"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-        
         # Create session record
-        timestamp = datetime.now().isoformat()
+        timestamp = int(datetime.now().timestamp())
         total_gains = 0
         
-        # Calculate total gains and validate entries
-        updates = []
+        # Calculate total gains and build both parameter lists in one pass
+        skill_rows = []
+        update_rows = []
         for attribute in entries:
             for skill in entries[attribute]:
                 try:
                     new_level = int(entries[attribute][skill].get() or 1)
                     new_level = max(1, min(100, new_level))  # Clamp to 1-100
-                    gain = new_level - 1  # Assuming starting from level 1
-                    total_gains += gain
-                    updates.append((attribute, skill, 1, new_level, gain))
                 except ValueError:
-                    updates.append((attribute, skill, 1, 1, 0))
-        
-        cursor.execute('''
-            INSERT INTO sessions (session_timestamp, total_gains, session_type, notes)
-            VALUES (?, ?, ?, ?)
-        ''', (timestamp, total_gains, "crystal_ball_assessment",
-              "Initial stat assessment using the mystical crystal ball"))
-        
-        session_id = cursor.lastrowid
+                    new_level = 1
+                gain = new_level - 1  # Assuming starting from level 1
+                total_gains += gain
+                skill_rows.append((attribute, skill, 1, new_level, gain))
+                update_rows.append((self._skill_id[(attribute, skill)], new_level))
         
-        # Update skills and record session updates
-        for attribute, skill, old_level, new_level, gain in updates:
+        with self._write_transaction() as cursor:
             cursor.execute('''
-                UPDATE skills 
-                SET current_level = ?, last_updated = ? 
-                WHERE attribute = ? AND skill_name = ?
-            ''', (new_level, timestamp, attribute, skill))
+                INSERT INTO sessions (session_timestamp, total_gains, session_type, notes)
+                VALUES (?, ?, ?, ?)
+            ''', (timestamp, total_gains, "crystal_ball_assessment",
+                  "Initial stat assessment using the mystical crystal ball"))
             
-            cursor.execute('''
-                INSERT INTO session_updates (session_id, attribute, skill_name, old_level, new_level, gain)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (session_id, attribute, skill, old_level, new_level, gain))
+            session_id = cursor.lastrowid
+            
+            # Update skills and record session updates in one batch each
+            self._update_skill_levels(cursor, timestamp, update_rows)
+            
+            self._insert_session_updates(cursor, session_id, skill_rows)
+    
+    @contextmanager
+    def _write_transaction(self):
+        """Run a block of writes as one transaction and drop the read caches on commit"""
+        cursor = self.conn.cursor()
+        # IMMEDIATE takes the write lock up front so the batch cannot hit SQLITE_BUSY midway
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            yield cursor
+        except BaseException:
+            # Leave the connection usable for the next save attempt
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+        self._skills_cache = None
+        self._sessions_cache = None
+        self._levels_cache = None
+    
+    def _update_skill_levels(self, cursor, timestamp, levels: list):
+        """Set (skill_id, new_level) pairs in a single CASE-WHEN UPDATE"""
+        if len(levels) < BULK_UPDATE_MIN_ROWS:
+            cursor.executemany(SQL_UPDATE_SKILL, [
+                (new_level, timestamp, skill_id) for skill_id, new_level in levels
+            ])
+            return
         
-        conn.commit()
-        conn.close()
+        ids = [skill_id for skill_id, new_level in levels]
+        cursor.execute(
+            'UPDATE skills SET current_level = CASE id '
+            + ' '.join(['WHEN ? THEN ?'] * len(levels))
+            + ' END, last_updated = ? WHERE id IN ({})'.format(','.join('?' * len(ids))),
+            [param for pair in levels for param in pair] + [timestamp] + ids
+        )
+    
+    def _insert_session_updates(self, cursor, session_id: int, updates: list):
+        """Record (attribute, skill, old, new, gain) rows for a session with one prepared statement"""
+        cursor.executemany(SQL_INSERT_SESSION_UPDATE, [
+            (session_id, attribute, skill, old_level, new_level, gain)
+            for attribute, skill, old_level, new_level, gain in updates
+        ])
     
     def process_skill_updates(self):
         """Process skill updates from the update tab"""
         updates = []
         total_gains = 0
         
-        current_skills = self.get_current_skills()
-        
-        for attribute in self.update_entries:
-            for skill in self.update_entries[attribute]:
-                entry_data = self.update_entries[attribute][skill]
-                new_value = entry_data['var'].get().strip()
-                current_level = entry_data['current']
-                
-                if new_value:
-                    try:
-                        new_level = int(new_value)
-                        
-                        # Validation
-                        if new_level < current_level:
-                            messagebox.showerror("Error", f"Cannot decrease {skill} level!")
-                            return
-                        
-                        if new_level > current_level + 10:
-                            messagebox.showerror("Error", f"Max +10 increase for {skill}!")
-                            return
-                        
-                        if new_level > 100:
-                            messagebox.showerror("Error", f"Max level is 100 for {skill}!")
-                            return
-                        
-                        if new_level > current_level:
-                            gain = new_level - current_level
-                            updates.append((attribute, skill, current_level, new_level, gain))
-                            total_gains += gain
+        # Only entries that were typed into can hold a value; visit them in tab order
+        for attribute, skill in sorted(self._dirty, key=self._entry_order.__getitem__):
+            entry_data = self.update_entries[attribute][skill]
+            new_value = entry_data['entry'].get().strip()
+            current_level = entry_data['current']
+            
+            if new_value:
+                try:
+                    new_level = int(new_value)
+                    
+                    # Validation
+                    if new_level < current_level:
+                        messagebox.showerror("Error", f"Cannot decrease {skill} level!")
+                        return
                     
-                    except ValueError:
-                        messagebox.showerror("Error", f"Invalid level for {skill}!")
+                    if new_level > current_level + 10:
+                        messagebox.showerror("Error", f"Max +10 increase for {skill}!")
                         return
+                    
+                    if new_level > 100:
+                        messagebox.showerror("Error", f"Max level is 100 for {skill}!")
+                        return
+                    
+                    if new_level > current_level:
+                        gain = new_level - current_level
+                        updates.append((attribute, skill, current_level, new_level, gain))
+                        total_gains += gain
+                
+                except ValueError:
+                    messagebox.showerror("Error", f"Invalid level for {skill}!")
+                    return
         
         if not updates:
             messagebox.showinfo("No Updates", "No changes to save.")
@@ -617,13 +954,13 @@ class SoloLevelingGUI:
         custom_date = self.custom_date_var.get().strip()
         if custom_date:
             try:
-                datetime.strptime(custom_date, "%Y-%m-%d")
-                timestamp = f"{custom_date}T{datetime.now().strftime('%H:%M:%S')}"
+                session_date = datetime.strptime(custom_date, "%Y-%m-%d")
+                timestamp = int(datetime.combine(session_date.date(), datetime.now().time()).timestamp())
             except ValueError:
                 messagebox.showerror("Error", "Invalid date format. Use YYYY-MM-DD")
                 return
         else:
-            timestamp = datetime.now().isoformat()
+            timestamp = int(datetime.now().timestamp())
         
         # Save to database
         self.save_update_session(timestamp, updates, total_gains)
@@ -631,93 +968,86 @@ class SoloLevelingGUI:
         messagebox.showinfo("Success!", f"Updated {len(updates)} skills with +{total_gains} total levels!")
         
         # Clear entries and refresh
-        for attribute in self.update_entries:
-            for skill in self.update_entries[attribute]:
-                self.update_entries[attribute][skill]['var'].set("")
+        for attribute, skill in self._dirty:
+            self.update_entries[attribute][skill]['var'].set("")
+        self._dirty.clear()
         
         self.custom_date_var.set("")
         self.refresh_all_data()
     
-    def save_update_session(self, timestamp: str, updates: list, total_gains: int):
+    def save_update_session(self, timestamp: int, updates: list, total_gains: int):
         """Save update session to database"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO sessions (session_timestamp, total_gains, session_type)
-            VALUES (?, ?, ?)
-        ''', (timestamp, total_gains, "skill_update"))
-        
-        session_id = cursor.lastrowid
-        
-        for attribute, skill, old_level, new_level, gain in updates:
+        with self._write_transaction() as cursor:
             cursor.execute('''
-                UPDATE skills 
-                SET current_level = ?, last_updated = ? 
-                WHERE attribute = ? AND skill_name = ?
-            ''', (new_level, timestamp, attribute, skill))
+                INSERT INTO sessions (session_timestamp, total_gains, session_type)
+                VALUES (?, ?, ?)
+            ''', (timestamp, total_gains, "skill_update"))
             
-            cursor.execute('''
-                INSERT INTO session_updates (session_id, attribute, skill_name, old_level, new_level, gain)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (session_id, attribute, skill, old_level, new_level, gain))
+            session_id = cursor.lastrowid
+            
+            self._update_skill_levels(cursor, timestamp, [
+                (self._skill_id[(attribute, skill)], new_level)
+                for attribute, skill, old_level, new_level, gain in updates
+            ])
+            
+            self._insert_session_updates(cursor, session_id, updates)
+    
+    def build_stats_items(self):
+        """Insert the stats tree rows once; refreshes only update their text"""
+        self._stats_items = {}
         
-        conn.commit()
-        conn.close()
+        for attribute in self.attributes:
+            # Attribute header row with its skills nested underneath
+            header = self.stats_tree.insert('', 'end', open=True, tags=('attribute',))
+            self._stats_items[attribute] = header
+            
+            for skill in self.attributes[attribute]:
+                self._stats_items[(attribute, skill)] = self.stats_tree.insert(
+                    header, 'end', values=(self._skill_display[skill], ''))
     
     def refresh_stats_display(self):
         """Refresh the stats display"""
-        # Clear existing content
-        for widget in self.stats_content_frame.winfo_children():
-            widget.destroy()
+        if not self._stats_items:
+            self.build_stats_items()
         
         skills = self.get_current_skills()
         
+        # All attribute levels in one vectorized pass
+        attr_levels = self._attribute_levels()
+        
         for attribute in self.attributes:
-            # Attribute frame
-            attr_frame = tk.Frame(self.stats_content_frame, bg='#34495e', relief=tk.RAISED, bd=2)
-            attr_frame.pack(fill=tk.X, padx=10, pady=5)
-            
-            # Attribute header
-            attr_level = self.calculate_attribute_level(attribute)
-            attr_display = attribute.replace("_", " ").title()
-            
-            header_label = tk.Label(attr_frame, 
-                                   text=f"📊 {attr_display} - Level {attr_level}/100",
-                                   font=('Arial', 14, 'bold'), fg='#f39c12', bg='#34495e')
-            header_label.pack(pady=5)
+            attr_level = attr_levels[attribute]
+            attr_display = self._attr_display[attribute]
+            self.stats_tree.item(self._stats_items[attribute],
+                                 text=f"📊 {attr_display} - Level {attr_level}/100")
             
-            # Skills grid
-            skills_frame = tk.Frame(attr_frame, bg='#34495e')
-            skills_frame.pack(fill=tk.X, padx=10, pady=5)
-            
-            # Create skills in a grid layout
             attr_skills = skills.get(attribute, {})
-            for i, skill in enumerate(self.attributes[attribute]):
-                row = i // 2
-                col = i % 2
-                
+            for skill in self.attributes[attribute]:
                 skill_level = attr_skills.get(skill, 1)
-                skill_display = skill.replace("_", " ").title()
-                
-                skill_label = tk.Label(skills_frame,
-                                     text=f"{skill_display}: {skill_level}/100",
-                                     font=('Arial', 10), fg='#ecf0f1', bg='#34495e',
-                                     width=35, anchor='w')
-                skill_label.grid(row=row, column=col, padx=5, pady=2, sticky='w')
+                self.stats_tree.item(self._stats_items[(attribute, skill)],
+                                     values=(self._skill_display[skill], f"{skill_level}/100"))
     
     def show_attribute_chart(self):
         """Show attribute levels chart"""
-        self.fig.clear()
+        self._load_plotting()
+        self._chart_shown = self.show_attribute_chart
         
         # Get attribute levels
-        attributes = []
-        levels = []
+        attr_levels = self._attribute_levels()
+        attributes = [self._attr_display[attribute] for attribute in self.attributes]
+        levels = [attr_levels[attribute] for attribute in self.attributes]
+        
+        if self._chart is not None and self._chart['kind'] == 'attribute':
+            # Chart is already on screen: resize the bars and move their labels
+            for bar, label, level in zip(self._chart['bars'], self._chart['labels'], levels):
+                bar.set_height(level)
+                label.xy = (label.xy[0], level)
+                label.set_text(f'{level}')
+            self._blit_chart()
+            return
         
-        for attribute in self.attributes:
-            attr_display = attribute.replace("_", " ").title()
-            attributes.append(attr_display)
-            levels.append(self.calculate_attribute_level(attribute))
+        self.fig.clear()
+        self._chart = None
         
         # Create bar chart
         ax = self.fig.add_subplot(111)
@@ -728,35 +1058,31 @@ class SoloLevelingGUI:
         ax.set_ylim(0, 100)
         
         # Add value labels on bars
-        for bar, level in zip(bars, levels):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + 1,
-                   f'{level}', ha='center', va='bottom', fontweight='bold')
+        labels = ax.bar_label(bars, padding=3, fontweight='bold')
         
         # Rotate x-axis labels for better readability
         plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
         
+        # The y-axis is fixed at 0-100, so later level changes can be blitted
+        for artist in (*bars, *labels):
+            artist.set_animated(True)
+        self._chart = {'kind': 'attribute', 'bars': list(bars), 'labels': labels,
+                       'animated': [*bars, *labels]}
+        
         self.fig.tight_layout()
         self.canvas.draw()
     
     def show_progress_chart(self):
         """Show progress over time chart"""
-        self.fig.clear()
-        
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
+        self._load_plotting()
+        self._chart_shown = self.show_progress_chart
         
         # Get session data over time
-        cursor.execute('''
-            SELECT session_timestamp, total_gains
-            FROM sessions
-            ORDER BY session_timestamp
-        ''')
-        
-        session_data = cursor.fetchall()
-        conn.close()
+        session_data = self.get_sessions()
         
         if not session_data:
+            self.fig.clear()
+            self._chart = None
             ax = self.fig.add_subplot(111)
             ax.text(0.5, 0.5, 'No session data yet!\nComplete some skill updates to see progress.',
                    ha='center', va='center', transform=ax.transAxes, fontsize=14)
@@ -764,50 +1090,90 @@ class SoloLevelingGUI:
             self.canvas.draw()
             return
         
-        # Convert to pandas for easier plotting
-        dates = [datetime.fromisoformat(session[0]) for session in session_data]
-        gains = [session[1] for session in session_data]
-        
-        # Calculate cumulative gains
-        cumulative_gains = np.cumsum(gains)
+        # Running totals come from the query's window function
+        df = pd.DataFrame(session_data, columns=['ts', 'type', 'gain', 'notes', 'cumulative', 'id', 'date'])
+        
+        # Epoch seconds -> naive local datetimes for the whole column at once
+        from dateutil.tz import tzlocal  # matplotlib dependency, already loaded
+        dates = (pd.to_datetime(df['ts'], unit='s', utc=True)
+                 .dt.tz_convert(tzlocal()).dt.tz_localize(None))
+        cumulative_gains = df['cumulative'].to_numpy()
+        
+        # Plot in date numbers so long histories can be decimated to the canvas width
+        x, y = min_max_decimate(mdates.date2num(dates.to_numpy()), cumulative_gains,
+                                int(self.fig.get_figwidth() * self.fig.dpi))
+        
+        if self._chart is not None and self._chart['kind'] == 'progress':
+            # Chart is already on screen: move the existing artists to the new data
+            ax = self._chart['ax']
+            self._chart['line'].set_data(x, y)
+            # Reshape the existing fill polygon: along the line, then back along y=0
+            verts = np.column_stack([np.r_[x, x[::-1]], np.r_[y, np.zeros_like(y)]])
+            self._chart['fill'].set_verts([verts])
+            ax.relim()
+            ax.update_datalim(verts)
+            ax.autoscale_view()
+            self.canvas.draw_idle()
+            return
         
+        self.fig.clear()
+        self._chart = None
         ax = self.fig.add_subplot(111)
-        ax.plot(dates, cumulative_gains, marker='o', linewidth=2, markersize=6, color='#3498db')
-        ax.fill_between(dates, cumulative_gains, alpha=0.3, color='#3498db')
+        line, = ax.plot(x, y, marker='o', linewidth=2, markersize=6, color='#3498db')
+        fill = ax.fill_between(x, y, alpha=0.3, color='#3498db')
+        self._init_progress_axes(ax)
         
+        self.fig.tight_layout()
+        self.canvas.draw()
+        
+        self._chart = {'kind': 'progress', 'ax': ax, 'line': line, 'fill': fill}
+    
+    def _init_progress_axes(self, ax):
+        """One-time labels and date tick setup; in-place refreshes keep them"""
         ax.set_title('Cumulative Level Gains Over Time', fontsize=16, fontweight='bold')
         ax.set_ylabel('Total Level Gains', fontsize=12)
         ax.set_xlabel('Date', fontsize=12)
         
-        # Format x-axis
+        # Format x-axis; ticks added later copy the rotation from the existing ones
         ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
         ax.xaxis.set_major_locator(mdates.MonthLocator())
         plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
         
         ax.grid(True, alpha=0.3)
-        self.fig.tight_layout()
-        self.canvas.draw()
     
     def show_skill_heatmap(self):
         """Show skill levels heatmap"""
-        self.fig.clear()
+        self._load_plotting()
+        self._chart_shown = self.show_skill_heatmap
         
         skills = self.get_current_skills()
         
-        # Prepare data for heatmap
-        skill_matrix = []
-        skill_labels = []
+        # Prepare data for heatmap in a preallocated level matrix
+        max_skills = max(len(self.attributes[attr]) for attr in self.attributes)
+        skill_matrix = np.ones((len(self.attributes), max_skills), dtype=np.int16)
+        skill_labels = [self._attr_display[attribute] for attribute in self.attributes]
+        row_lengths = [len(self.attributes[attribute]) for attribute in self.attributes]
         
-        for attribute in self.attributes:
+        for i, attribute in enumerate(self.attributes):
             attr_skills = skills.get(attribute, {})
-            skill_row = []
-            for skill in self.attributes[attribute]:
-                skill_row.append(attr_skills.get(skill, 1))
-            skill_matrix.append(skill_row)
-            skill_labels.append(attribute.replace("_", " ").title())
+            for j, skill in enumerate(self.attributes[attribute]):
+                skill_matrix[i, j] = attr_skills.get(skill, 1)
+        
+        if self._chart is not None and self._chart['kind'] == 'heatmap':
+            # Chart is already on screen: swap the image data and re-text changed cells only
+            texts = self._chart['texts']
+            for i, j in np.argwhere(skill_matrix != self._chart['matrix']):
+                if (i, j) in texts:
+                    texts[i, j].set_text(str(skill_matrix[i, j]))
+            self._chart['image'].set_data(skill_matrix)
+            self._chart['matrix'] = skill_matrix
+            self._blit_chart()
+            return
+        
+        self.fig.clear()
+        self._chart = None
         
         # Create skill names for x-axis (truncated for space)
-        max_skills = max(len(self.attributes[attr]) for attr in self.attributes)
         skill_names = []
         for i in range(max_skills):
             skill_names.append(f'Skill {i+1}')
@@ -829,55 +1195,58 @@ class SoloLevelingGUI:
         
         ax.set_title('Skill Levels Heatmap', fontsize=16, fontweight='bold')
         
-        # Add text annotations
-        for i in range(len(self.attributes)):
-            for j in range(len(skill_matrix[i])):
-                text = ax.text(j, i, skill_matrix[i][j],
-                             ha="center", va="center", color="black", fontweight='bold')
+        # Add text annotations (padding cells of shorter attributes stay blank)
+        texts = {}
+        for (i, j), level in np.ndenumerate(skill_matrix):
+            if j < row_lengths[i]:
+                texts[i, j] = ax.text(j, i, int(level),
+                                      ha="center", va="center", color="black", fontweight='bold')
+        
+        # The image extent and color scale are fixed, so later level changes can be blitted
+        animated = [im, *texts.values()]
+        for artist in animated:
+            artist.set_animated(True)
+        self._chart = {'kind': 'heatmap', 'image': im, 'texts': texts, 'animated': animated,
+                       'matrix': skill_matrix}
         
         self.fig.tight_layout()
         self.canvas.draw()
     
     def refresh_history_display(self):
         """Refresh the session history display"""
-        # Clear existing items
-        for item in self.history_tree.get_children():
-            self.history_tree.delete(item)
-        
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT session_timestamp, session_type, total_gains, notes
-            FROM sessions
-            ORDER BY session_timestamp DESC
-        ''')
-        
-        sessions = cursor.fetchall()
-        conn.close()
-        
-        for session in sessions:
-            timestamp, session_type, total_gains, notes = session
-            
-            # Format timestamp
-            try:
-                dt = datetime.fromisoformat(timestamp)
-                formatted_date = dt.strftime('%Y-%m-%d %H:%M')
-            except:
-                formatted_date = timestamp
+        # Sessions never change once written, so rows are keyed by session id and
+        # only sessions not yet in the tree are inserted at their sorted position
+        sessions = self.get_sessions()[::-1]
+        wanted = [str(session[5]) for session in sessions]
+        shown = set(self._history_iids)
+        
+        stale = shown.difference(wanted)
+        if stale:
+            self.history_tree.delete(*stale)
+        
+        for index, session in enumerate(sessions):
+            timestamp, session_type, total_gains, notes, cumulative, session_id, formatted_date = session
+            iid = wanted[index]
+            if iid in shown:
+                continue
             
             # Format session type
-            session_type_display = session_type.replace("_", " ").title()
+            session_type_display = self._session_type_display.get(session_type)
+            if session_type_display is None:
+                session_type_display = session_type.replace("_", " ").title()
+                self._session_type_display[session_type] = session_type_display
             
             # Handle None notes
             notes_display = notes if notes else ""
             
-            self.history_tree.insert('', 'end', values=(
+            self.history_tree.insert('', index, iid=iid, values=(
                 formatted_date,
                 session_type_display,
                 f"+{total_gains}",
                 notes_display
             ))
+        
+        self._history_iids = wanted
     
     def refresh_all_data(self):
         """Refresh all displays and update overall level"""
@@ -886,18 +1255,21 @@ class SoloLevelingGUI:
         current_level = self.calculate_overall_level()
         self.overall_level_label.config(text=f"🏆 OVERALL LEVEL: {current_level}/{max_level}")
         
-        # Refresh all tab displays
-        self.refresh_stats_display()
-        self.refresh_history_display()
-        self.show_attribute_chart()
+        # Only the visible tab is redrawn now; the others when they are next selected.
+        # They all read the same write-invalidated caches, so nothing is re-queried
+        self._stale_tabs = {'stats', 'history', 'chart'}
+        self._refresh_visible_tab()
+        
+        skills_snapshot = self.get_current_skills()
         
         # Update current levels in update entries
-        current_skills = self.get_current_skills()
-        for attribute in self.update_entries:
-            for skill in self.update_entries[attribute]:
-                new_level = current_skills.get(attribute, {}).get(skill, 1)
-                self.update_entries[attribute][skill]['current'] = new_level
-                self.update_entries[attribute][skill]['label'].config(text=f"[{new_level}]")
+        for attribute, entries in self.update_entries.items():
+            attr_skills = skills_snapshot.get(attribute, {})
+            for skill, entry_data in entries.items():
+                new_level = attr_skills.get(skill, 1)
+                if entry_data['current'] != new_level:
+                    entry_data['current'] = new_level
+                    entry_data['label'].config(text=f"[{new_level}]")
     
     def run(self):
         """Start the GUI application"""
@@ -906,6 +1278,7 @@ class SoloLevelingGUI:
 def main():
     """Main function to run the Solo Leveling System"""
     app = SoloLevelingGUI()
+    atexit.register(app.close)
     app.run()
 
 if __name__ == "__main__":
@@ -0,0 +1,32 @@
+import importlib
+import importlib.util
+import os
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+MODULES = ("sl", "slv2", "slv3", "tokyo_night_gui")
+
+
+def _installed(*names):
+    return all(importlib.util.find_spec(name) is not None for name in names)
+
+
+class ModuleSourceTest(unittest.TestCase):
+    def test_modules_compile(self):
+        for name in MODULES:
+            with self.subTest(module=name):
+                with open(os.path.join(ROOT, f"{name}.py"), encoding="utf-8") as f:
+                    compile(f.read(), f"{name}.py", "exec")
+    
+    @unittest.skipUnless(_installed("tkinter", "matplotlib", "pandas", "numpy"),
+                         "GUI dependencies are not installed")
+    def test_tokyo_night_gui_imports(self):
+        module = importlib.import_module("tokyo_night_gui")
+        self.assertTrue(callable(module.main))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sl
+
+
+class TempDirTestCase(unittest.TestCase):
+    """Run each test in an empty directory; the app reads and writes its files in the cwd"""
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+    
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+
+class LoadDataTest(TempDirTestCase):
+    def test_out_of_range_levels_are_clamped(self):
+        with open("leveling_data.json", "w") as f:
+            json.dump({"skill_levels": {"life_skills": {
+                "communication": 300,
+                "time_management": -1,
+                "cooking_nutrition": "7",
+                "independence": 42,
+            }}}, f)
+        
+        levels = sl.SoloLevelingSystem().skill_levels_dict()["life_skills"]
+        self.assertEqual(levels["communication"], 100)
+        self.assertEqual(levels["time_management"], 1)
+        self.assertEqual(levels["cooking_nutrition"], 1)
+        self.assertEqual(levels["independence"], 42)
+
+
+
+class ViewHistoryTest(TempDirTestCase):
+    def test_truncated_last_line_is_skipped(self):
+        session = {"timestamp": "2024-01-05T10:30:00",
+                   "updates": {"career": {"technical_mastery": {"old": 1, "new": 4, "gain": 3}}}}
+        with open("leveling_sessions.jsonl", "w") as f:
+            f.write(json.dumps(session) + "\n")
+            f.write(json.dumps(session)[:25])
+        
+        out = io.StringIO()
+        with redirect_stdout(out):
+            sl.SoloLevelingSystem().view_history()
+        self.assertIn("1. Session: 2024-01-05 10:30", out.getvalue())
+        self.assertIn("Total gains: +3 levels", out.getvalue())
+        self.assertNotIn("2. Session", out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,76 +1,157 @@
 import sqlite3
 import math
 import json
+from types import MappingProxyType
+from functools import lru_cache
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
+from tkinter import font as tkfont
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
-import seaborn as sns
 from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
 
 # Set style for better looking plots
 plt.style.use('dark_background')
-sns.set_palette("husl")
+
+# PRAGMA user_version once stored timestamps are epoch seconds; the database is shared with
+# the console and slv3 front ends, which migrate to the same version
+SCHEMA_VERSION = 1
+
+def _sigmoid_levels_loop(totals, maxes):
+    """Per-element sigmoid levels, written as a plain loop for njit"""
+    levels = np.empty(totals.shape[0], dtype=np.int32)
+    for i in range(totals.shape[0]):
+        if totals[i] <= 0:
+            levels[i] = 1
+            continue
+        x = totals[i] / maxes[i]
+        level = int(1 + 99 / (1 + math.exp(-10 * (x - 0.5))))
+        levels[i] = min(level, 100)
+    return levels
+
+_sigmoid_kernel = None  # Compiled loop, or None while only the NumPy fallback is available
+
+def _compile_sigmoid_kernel():
+    """Build the njit version of _sigmoid_levels_loop if Numba is installed"""
+    global _sigmoid_kernel
+    if _sigmoid_kernel is not None:
+        return
+    try:
+        from numba import njit
+    except ImportError:
+        return
+    kernel = njit(cache=True)(_sigmoid_levels_loop)
+    kernel(np.zeros(1), np.ones(1))  # njit compiles lazily; trigger it here rather than mid-refresh
+    _sigmoid_kernel = kernel
+
+def min_max_decimate(x: np.ndarray, y: np.ndarray, target_px: int):
+    """Thin a long series to each pixel bucket's lowest and highest point, in x order"""
+    n = len(y)
+    if n <= 2 * target_px:
+        return x, y
+    
+    bucket = n // target_px
+    usable = bucket * target_px
+    xs = x[:usable].reshape(target_px, bucket)
+    ys = y[:usable].reshape(target_px, bucket)
+    
+    rows = np.arange(target_px)[:, None]
+    picks = np.sort(np.column_stack([ys.argmin(axis=1), ys.argmax(axis=1)]), axis=1)
+    return (np.concatenate([xs[rows, picks].ravel(), x[usable:]]),
+            np.concatenate([ys[rows, picks].ravel(), y[usable:]]))
 
 class SoloLevelingGUI:
-    def __init__(self):
-        self.colors = {
-            "bg_main": "#1a1b26",      # Main background
-            "bg_frame": "#24283b",     # Inner frames
-            "bg_secondary": "#16161e", # Secondary background
-            "fg_text": "#c0caf5",      # Regular text
-            "fg_accent": "#7aa2f7",    # Accent (titles, highlights)
-            "fg_secondary": "#9aa5ce", # Secondary text
-            "button_bg": "#414868",    # Button background
-            "button_fg": "#c0caf5",    # Button text
-            "button_hover": "#565f89", # Button hover
-            "highlight": "#bb9af7",    # Special highlights
-            "success": "#9ece6a",      # Success color
-            "warning": "#e0af68",      # Warning color
-            "error": "#f7768e",        # Error color
-            "border": "#414868",       # Border color
-        }
+    # Theme and skill metadata are shared by every instance and never change
+    colors = MappingProxyType({
+        "bg_main": "#1a1b26",      # Main background
+        "bg_frame": "#24283b",     # Inner frames
+        "bg_secondary": "#16161e", # Secondary background
+        "fg_text": "#c0caf5",      # Regular text
+        "fg_accent": "#7aa2f7",    # Accent (titles, highlights)
+        "fg_secondary": "#9aa5ce", # Secondary text
+        "button_bg": "#414868",    # Button background
+        "button_fg": "#c0caf5",    # Button text
+        "button_hover": "#565f89", # Button hover
+        "highlight": "#bb9af7",    # Special highlights
+        "success": "#9ece6a",      # Success color
+        "warning": "#e0af68",      # Warning color
+        "error": "#f7768e",        # Error color
+        "border": "#414868",       # Border color
+    })
 
-        self.attributes = {
-            "life_skills": [
-                "communication", "critical_thinking_problem_solving", "time_management",
-                "self_care_emotional_regulation", "cooking_nutrition", "car_home_maintenance",
-                "digital_literacy", "interpersonal_social_skills", "independence", "learning_efficiency"
-            ],
-            "content_creation": [
-                "seo_literacy", "video_editing", "streaming", "long_form_content_output",
-                "short_form_content_output", "charisma", "personality_authenticity",
-                "online_presence", "consistency", "backlog_management"
-            ],
-            "financial_literacy": [
-                "budgeting_savings", "emergency_fund_management", "investment_knowledge",
-                "retirement_contributions_roth", "401k_optimization", "hsa_utilization",
-                "insurance_literacy", "loan_understanding", "tax_optimization", "financial_goal_tracking"
-            ],
-            "career": [
-                "technical_mastery", "soft_skills_work", "time_management_work",
-                "growth_milestones", "professional_networking", "contribution_tracking",
-                "performance_feedback", "industry_knowledge", "leadership_development", "project_management"
-            ],
-            "vision_strategy": [
-                "daily_goal_setting", "weekly_planning", "monthly_goal_review",
-                "quarterly_assessment", "yearly_vision_alignment", "system_design",
-                "reflection_reviewing", "strategic_thinking", "priority_management", "personal_roadmapping"
-            ]
-        }
-        
+    attributes = MappingProxyType({
+        "life_skills": (
+            "communication", "critical_thinking_problem_solving", "time_management",
+            "self_care_emotional_regulation", "cooking_nutrition", "car_home_maintenance",
+            "digital_literacy", "interpersonal_social_skills", "independence", "learning_efficiency"
+        ),
+        "content_creation": (
+            "seo_literacy", "video_editing", "streaming", "long_form_content_output",
+            "short_form_content_output", "charisma", "personality_authenticity",
+            "online_presence", "consistency", "backlog_management"
+        ),
+        "financial_literacy": (
+            "budgeting_savings", "emergency_fund_management", "investment_knowledge",
+            "retirement_contributions_roth", "401k_optimization", "hsa_utilization",
+            "insurance_literacy", "loan_understanding", "tax_optimization", "financial_goal_tracking"
+        ),
+        "career": (
+            "technical_mastery", "soft_skills_work", "time_management_work",
+            "growth_milestones", "professional_networking", "contribution_tracking",
+            "performance_feedback", "industry_knowledge", "leadership_development", "project_management"
+        ),
+        "vision_strategy": (
+            "daily_goal_setting", "weekly_planning", "monthly_goal_review",
+            "quarterly_assessment", "yearly_vision_alignment", "system_design",
+            "reflection_reviewing", "strategic_thinking", "priority_management", "personal_roadmapping"
+        )
+    })
+    
+    # Each attribute's maximum skill points (skills x 100)
+    _max_points = MappingProxyType({attr: len(skills) * 100 for attr, skills in attributes.items()})
+    
+    # Display names for tab labels and rows, formatted once instead of on every rebuild
+    _attr_display = MappingProxyType({attr: attr.replace("_", " ").title() for attr in attributes})
+    _skill_display = MappingProxyType({
+        skill: skill.replace("_", " ").title()
+        for skills in attributes.values() for skill in skills
+    })
+    
+    _styled = False  # ttk styles live in the Tcl interpreter, so configure them only once
+    
+    def __init__(self):
         self.db_file = "solo_leveling.db"
+        # One long-lived connection for the GUI thread; writes use explicit BEGIN/commit()
+        self.conn = sqlite3.connect(self.db_file, isolation_level=None, check_same_thread=False)
         self.init_database()
         
+        # Skill rows never change identity, so writers can address them by primary key
+        cursor = self.conn.cursor()
+        cursor.execute('SELECT id, attribute, skill_name FROM skills')
+        self._skill_id = {(attribute, skill): skill_id for skill_id, attribute, skill in cursor.fetchall()}
+        self._skills_cache = None
+        self._attribute_sums_cache = None
+        self._attribute_levels_cache = None
+        self._session_type_display = {}  # Filled as session types are first seen
+        
         # Initialize GUI
         self.root = tk.Tk()
         self.root.title("🎮 Solo Leveling System V3 🎮")
         self.root.geometry("1400x900")
         self.root.configure(bg=self.colors["bg_main"])
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        # Named fonts are created once and shared by every widget that uses them
+        self.font_body = tkfont.Font(root=self.root, family='Segoe UI', size=10)
+        self.font_bold = tkfont.Font(root=self.root, family='Segoe UI', size=10, weight='bold')
+        self.font_large = tkfont.Font(root=self.root, family='Segoe UI', size=12)
+        self.font_button_large = tkfont.Font(root=self.root, family='Segoe UI', size=14, weight='bold')
+        self.font_title = tkfont.Font(root=self.root, family='Segoe UI', size=22, weight='bold')
+        self.font_h1 = tkfont.Font(root=self.root, family='Segoe UI', size=26, weight='bold')
         
         # Configure ttk style for Tokyo Night theme
         self.setup_ttk_style()
@@ -80,63 +161,88 @@ class SoloLevelingGUI:
         
         self.setup_gui()
         
+        # The window is up by the time Tk goes idle, so the Numba import and compile
+        # happen after first paint; levels computed before that use NumPy
+        self.root.after_idle(_compile_sigmoid_kernel)
+        
         # Handle first run
         if self.is_first_run:
             self.root.after(1000, self.show_crystal_ball_welcome)  # Delay to let GUI load
     
-    def setup_ttk_style(self):
-        """Configure ttk styles for Tokyo Night theme"""
+    def close(self):
+        """Close the shared database connection"""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+    
+    def on_close(self):
+        """Release the database before the main window goes away"""
+        self.close()
+        self.root.destroy()
+    
+    @classmethod
+    def setup_ttk_style(cls):
+        """Configure ttk styles for Tokyo Night theme (once per process)"""
+        if cls._styled:
+            return
+        cls._styled = True
+        colors = cls.colors
         style = ttk.Style()
         
         # Configure Notebook style
         style.theme_use('clam')
         style.configure('TNotebook', 
-                       background=self.colors["bg_frame"],
+                       background=colors["bg_frame"],
                        borderwidth=0)
         style.configure('TNotebook.Tab',
-                       background=self.colors["button_bg"],
-                       foreground=self.colors["fg_text"],
+                       background=colors["button_bg"],
+                       foreground=colors["fg_text"],
                        padding=[20, 8],
                        borderwidth=1,
                        focuscolor='none')
         style.map('TNotebook.Tab',
-                 background=[('selected', self.colors["fg_accent"]),
-                           ('active', self.colors["button_hover"])],
-                 foreground=[('selected', self.colors["bg_main"]),
-                           ('active', self.colors["fg_text"])])
+                 background=[('selected', colors["fg_accent"]),
+                           ('active', colors["button_hover"])],
+                 foreground=[('selected', colors["bg_main"]),
+                           ('active', colors["fg_text"])])
         
         # Configure Frame style
-        style.configure('TFrame', background=self.colors["bg_frame"])
+        style.configure('TFrame', background=colors["bg_frame"])
         
         # Configure Treeview style
         style.configure('Treeview',
-                       background=self.colors["bg_frame"],
-                       foreground=self.colors["fg_text"],
-                       fieldbackground=self.colors["bg_frame"],
+                       background=colors["bg_frame"],
+                       foreground=colors["fg_text"],
+                       fieldbackground=colors["bg_frame"],
                        borderwidth=1,
                        relief='solid')
         style.configure('Treeview.Heading',
-                       background=self.colors["button_bg"],
-                       foreground=self.colors["fg_text"],
+                       background=colors["button_bg"],
+                       foreground=colors["fg_text"],
                        borderwidth=1,
                        relief='solid')
         style.map('Treeview',
-                 background=[('selected', self.colors["fg_accent"])],
-                 foreground=[('selected', self.colors["bg_main"])])
+                 background=[('selected', colors["fg_accent"])],
+                 foreground=[('selected', colors["bg_main"])])
         
         # Configure Scrollbar style
         style.configure('TScrollbar',
-                       background=self.colors["button_bg"],
-                       troughcolor=self.colors["bg_secondary"],
+                       background=colors["button_bg"],
+                       troughcolor=colors["bg_secondary"],
                        borderwidth=0,
-                       arrowcolor=self.colors["fg_text"])
+                       arrowcolor=colors["fg_text"])
         style.map('TScrollbar',
-                 background=[('active', self.colors["button_hover"])])
+                 background=[('active', colors["button_hover"])])
     
     def init_database(self):
         """Initialize SQLite database with required tables"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
+        
+        # Connection tuning must happen outside a transaction; WAL persists in the file
+        for pragma in ("journal_mode=WAL", "synchronous=NORMAL", "temp_store=MEMORY"):
+            cursor.execute(f"PRAGMA {pragma}")
+        
+        cursor.execute('BEGIN')
         
         # Skills table
         cursor.execute('''
@@ -149,6 +255,8 @@ class SoloLevelingGUI:
                 UNIQUE(attribute, skill_name)
             )
         ''')
+        # Covers the per-attribute SUM/GROUP BY so it never touches the table itself
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_skills_attr_level ON skills(attribute, current_level)')
         
         # Sessions table
         cursor.execute('''
@@ -174,36 +282,53 @@ class SoloLevelingGUI:
                 FOREIGN KEY (session_id) REFERENCES sessions (id)
             )
         ''')
+        # Backs the session -> updates join in the history view
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_session_updates_sid ON session_updates(session_id)')
+        
+        # Earlier versions wrote local ISO-8601 text (CURRENT_TIMESTAMP defaults are UTC);
+        # convert those rows to epoch seconds the first time this database is opened
+        cursor.execute('PRAGMA user_version')
+        if cursor.fetchone()[0] < SCHEMA_VERSION:
+            cursor.execute('''
+                UPDATE sessions
+                SET session_timestamp = CAST(strftime('%s', session_timestamp, 'utc') AS INTEGER)
+                WHERE typeof(session_timestamp) = 'text'
+            ''')
+            cursor.execute('''
+                UPDATE skills
+                SET last_updated = CAST(CASE WHEN instr(last_updated, 'T')
+                                             THEN strftime('%s', last_updated, 'utc')
+                                             ELSE strftime('%s', last_updated) END AS INTEGER)
+                WHERE typeof(last_updated) = 'text'
+            ''')
+            cursor.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
         
         # Initialize skills if empty
         cursor.execute('SELECT COUNT(*) FROM skills')
         if cursor.fetchone()[0] == 0:
-            for attribute in self.attributes:
-                for skill in self.attributes[attribute]:
-                    cursor.execute('''
-                        INSERT OR IGNORE INTO skills (attribute, skill_name, current_level)
-                        VALUES (?, ?, ?)
-                    ''', (attribute, skill, 1))
+            now = int(datetime.now().timestamp())
+            cursor.executemany('''
+                INSERT OR IGNORE INTO skills (attribute, skill_name, current_level, last_updated)
+                VALUES (?, ?, ?, ?)
+            ''', [(attribute, skill, 1, now) for attribute, skills in self.attributes.items() for skill in skills])
         
-        conn.commit()
-        conn.close()
+        self.conn.commit()
     
     def check_first_run(self) -> bool:
         """Check if this is the user's first time running the system"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT COUNT(*) FROM skills WHERE current_level > 1')
-        has_progress = cursor.fetchone()[0] > 0
+        cursor = self.conn.cursor()
         
-        cursor.execute('SELECT COUNT(*) FROM sessions')
-        has_sessions = cursor.fetchone()[0] > 0
-        
-        conn.close()
-        return not (has_progress or has_sessions)
+        # EXISTS stops at the first matching row, unlike COUNT(*)
+        cursor.execute('''
+            SELECT EXISTS(SELECT 1 FROM skills WHERE current_level > 1)
+                 + EXISTS(SELECT 1 FROM sessions)
+        ''')
+        return cursor.fetchone()[0] == 0
     
-    def sigmoid_level_calculation(self, total_points: int, max_points: int) -> int:
-        """Calculate level using sigmoid curve"""
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def sigmoid_level_calculation(total_points: int, max_points: int) -> int:
+        """Calculate level using sigmoid curve (memoized; the input domain is tiny)"""
         if total_points <= 0:
             return 1
         
@@ -212,29 +337,62 @@ class SoloLevelingGUI:
         level = int(1 + sigmoid_value * 99)
         return min(level, 100)
     
+    @staticmethod
+    def sigmoid_levels(totals: np.ndarray, maxes: np.ndarray) -> np.ndarray:
+        """Vectorized sigmoid_level_calculation over arrays of totals and maxima"""
+        if _sigmoid_kernel is not None:
+            return _sigmoid_kernel(totals, maxes)
+        
+        x = totals / maxes
+        levels = (1 + 99 / (1 + np.exp(-10 * (x - 0.5)))).astype(np.int32)
+        levels = np.clip(levels, 1, 100)
+        return np.where(totals <= 0, 1, levels)
+    
+    def _attribute_sums(self) -> dict:
+        """Skill level sums for every attribute in one query, cached until skills change"""
+        if self._attribute_sums_cache is None:
+            cursor = self.conn.cursor()
+            cursor.execute('SELECT attribute, SUM(current_level) FROM skills GROUP BY attribute')
+            self._attribute_sums_cache = dict(cursor.fetchall())
+        return self._attribute_sums_cache
+    
+    def _invalidate_skills_cache(self):
+        """Drop cached reads of the skills table after a write"""
+        self._skills_cache = None
+        self._attribute_sums_cache = None
+        self._attribute_levels_cache = None
+    
+    def _attribute_levels(self) -> dict:
+        """Level of every attribute as {attribute: level}, computed in one NumPy pass"""
+        if self._attribute_levels_cache is None:
+            attribute_sums = self._attribute_sums()
+            totals = np.fromiter((attribute_sums.get(attr) or 0 for attr in self.attributes),
+                                 dtype=np.float64, count=len(self.attributes))
+            maxes = np.fromiter(self._max_points.values(), dtype=np.float64, count=len(self._max_points))
+            levels = self.sigmoid_levels(totals, maxes)
+            self._attribute_levels_cache = dict(zip(self.attributes, levels.tolist()))
+        return self._attribute_levels_cache
+    
     def calculate_attribute_level(self, attribute: str) -> int:
         """Calculate attribute level based on sum of all skills"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT SUM(current_level) FROM skills WHERE attribute = ?', (attribute,))
-        total_skill_points = cursor.fetchone()[0] or 0
-        
-        conn.close()
-        
-        max_skill_points = len(self.attributes[attribute]) * 100
-        return self.sigmoid_level_calculation(total_skill_points, max_skill_points)
+        total_skill_points = self._attribute_sums().get(attribute) or 0
+        return self.sigmoid_level_calculation(total_skill_points, self._max_points[attribute])
     
     def calculate_overall_level(self) -> int:
         """Calculate overall level based on sum of all attribute levels (out of 500)"""
-        total_attribute_points = sum(self.calculate_attribute_level(attr) for attr in self.attributes)
+        total_attribute_points = sum(self._attribute_levels().values())
         max_attribute_points = len(self.attributes) * 100  # 5 attributes × 100 = 500
         return total_attribute_points  # Return raw sum for display as X/500
     
     def get_current_skills(self) -> dict:
-        """Get current skill levels from database"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
+        """Get current skill levels, cached until the next write"""
+        if self._skills_cache is None:
+            self._skills_cache = self._fetch_all_skills()
+        return self._skills_cache
+    
+    def _fetch_all_skills(self) -> dict:
+        """Read every skill level in one query as {attribute: {skill: level}}"""
+        cursor = self.conn.cursor()
         
         cursor.execute('SELECT attribute, skill_name, current_level FROM skills ORDER BY attribute, skill_name')
         rows = cursor.fetchall()
@@ -245,7 +403,6 @@ class SoloLevelingGUI:
                 skills[attribute] = {}
             skills[attribute][skill_name] = level
         
-        conn.close()
         return skills
     
     def create_tokyo_button(self, parent, text, command, bg_color=None, width=None):
@@ -256,7 +413,7 @@ class SoloLevelingGUI:
         button = tk.Button(parent, 
                           text=text,
                           command=command,
-                          font=('Segoe UI', 10, 'bold'),
+                          font=self.font_bold,
                           bg=bg_color,
                           fg=self.colors["button_fg"],
                           activebackground=self.colors["button_hover"],
@@ -291,7 +448,7 @@ class SoloLevelingGUI:
         # Title
         title_label = tk.Label(main_frame, 
                               text="🎮 SOLO LEVELING SYSTEM 🎮", 
-                              font=('Segoe UI', 26, 'bold'), 
+                              font=self.font_h1, 
                               fg=self.colors["fg_accent"], 
                               bg=self.colors["bg_main"])
         title_label.pack(pady=(0, 25))
@@ -307,7 +464,7 @@ class SoloLevelingGUI:
         current_level = self.calculate_overall_level()
         self.overall_level_label = tk.Label(self.overall_level_frame, 
                                            text=f"🏆 OVERALL LEVEL: {current_level}/{max_level}",
-                                           font=('Segoe UI', 22, 'bold'), 
+                                           font=self.font_title, 
                                            fg=self.colors["warning"], 
                                            bg=self.colors["bg_frame"])
         self.overall_level_label.pack(pady=15)
@@ -316,11 +473,16 @@ class SoloLevelingGUI:
         self.notebook = ttk.Notebook(main_frame)
         self.notebook.pack(fill=tk.BOTH, expand=True)
         
-        # Setup tabs
+        # Setup tabs; only stats is visible at startup, the rest are built on first selection
         self.setup_stats_tab()
-        self.setup_update_tab()
-        self.setup_progress_tab()
-        self.setup_history_tab()
+        self._tab_builders = {}
+        for tab_text, builder in (("📈 Update Skills", self.setup_update_tab),
+                                  ("📈 Progress Charts", self.setup_progress_tab),
+                                  ("📚 Session History", self.setup_history_tab)):
+            tab_frame = ttk.Frame(self.notebook)
+            self.notebook.add(tab_frame, text=tab_text)
+            self._tab_builders[str(tab_frame)] = (builder, tab_frame)
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
         
         # Button frame
         button_frame = tk.Frame(main_frame, bg=self.colors["bg_main"])
@@ -340,36 +502,102 @@ class SoloLevelingGUI:
                                                  self.colors["success"])
         refresh_button.pack(side=tk.LEFT)
     
-    def setup_stats_tab(self):
-        """Setup the current stats tab"""
-        stats_frame = ttk.Frame(self.notebook)
-        self.notebook.add(stats_frame, text="📊 Current Stats")
-        
-        # Create canvas and scrollbar for stats
-        canvas = tk.Canvas(stats_frame, bg=self.colors["bg_main"], highlightthickness=0)
-        scrollbar = ttk.Scrollbar(stats_frame, orient="vertical", command=canvas.yview)
+    def _on_tab_changed(self, event=None):
+        """Build a deferred tab the first time it is selected"""
+        pending = self._tab_builders.pop(self.notebook.select(), None)
+        if pending is not None:
+            builder, tab_frame = pending
+            builder(tab_frame)
+    
+    def _make_scrollable(self, parent):
+        """Create a vertically scrollable canvas in parent and return (canvas, inner frame)"""
+        canvas = tk.Canvas(parent, bg=self.colors["bg_main"], highlightthickness=0)
+        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
         scrollable_frame = tk.Frame(canvas, bg=self.colors["bg_main"])
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # A resize fires <Configure> for every pixel; recompute bbox("all") once per idle cycle
+        pending = []
+        
+        def update_scrollregion():
+            pending.clear()
+            canvas.configure(scrollregion=canvas.bbox("all"))
+        
+        def on_configure(event):
+            if not pending:
+                pending.append(canvas.after_idle(update_scrollregion))
+        
+        scrollable_frame.bind("<Configure>", on_configure)
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
-        # Pack canvas and scrollbar
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
+        return canvas, scrollable_frame
+    
+    def setup_stats_tab(self):
+        """Setup the current stats tab"""
+        stats_frame = ttk.Frame(self.notebook)
+        self.notebook.add(stats_frame, text="📊 Current Stats")
+        
+        # Create canvas and scrollbar for stats
+        canvas, scrollable_frame = self._make_scrollable(stats_frame)
+        
         self.stats_content_frame = scrollable_frame
+        self._stats_labels = {}
         self.refresh_stats_display()
     
-    def setup_update_tab(self):
-        """Setup the skill update tab"""
-        update_frame = ttk.Frame(self.notebook)
-        self.notebook.add(update_frame, text="📈 Update Skills")
+    def _build_stats_labels(self):
+        """Create the stats tab's labels once; refreshes only change their text"""
+        for attribute in self.attributes:
+            attr_frame = tk.Frame(self.stats_content_frame, bg=self.colors["bg_frame"])
+            attr_frame.pack(fill=tk.X, padx=15, pady=8)
+            
+            header = tk.Label(attr_frame,
+                              font=self.font_large,
+                              fg=self.colors["warning"],
+                              bg=self.colors["bg_frame"],
+                              anchor='w')
+            header.pack(fill=tk.X, padx=10, pady=(10, 5))
+            self._stats_labels[attribute] = header
+            
+            for skill in self.attributes[attribute]:
+                skill_frame = tk.Frame(attr_frame, bg=self.colors["bg_frame"])
+                skill_frame.pack(fill=tk.X, padx=25, pady=1)
+                
+                tk.Label(skill_frame,
+                         text=self._skill_display[skill],
+                         font=self.font_body,
+                         fg=self.colors["fg_text"],
+                         bg=self.colors["bg_frame"],
+                         width=35,
+                         anchor='w').pack(side=tk.LEFT)
+                level_label = tk.Label(skill_frame,
+                                       font=self.font_bold,
+                                       fg=self.colors["fg_accent"],
+                                       bg=self.colors["bg_frame"])
+                level_label.pack(side=tk.LEFT)
+                self._stats_labels[(attribute, skill)] = level_label
+    
+    def refresh_stats_display(self):
+        """Refresh the stats display"""
+        if not self._stats_labels:
+            self._build_stats_labels()
+        
+        skills = self.get_current_skills()
+        attr_levels = self._attribute_levels()
         
+        for attribute in self.attributes:
+            self._stats_labels[attribute].config(
+                text=f"📊 {self._attr_display[attribute]} - Level {attr_levels[attribute]}/100")
+            
+            attr_skills = skills.get(attribute, {})
+            for skill in self.attributes[attribute]:
+                self._stats_labels[(attribute, skill)].config(text=f"{attr_skills.get(skill, 1)}/100")
+    
+    def setup_update_tab(self, update_frame):
+        """Setup the skill update tab"""
         # Main container
         main_container = tk.Frame(update_frame, bg=self.colors["bg_main"])
         main_container.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
@@ -377,7 +605,7 @@ class SoloLevelingGUI:
         # Instructions
         instructions = tk.Label(main_container, 
                                text="Select skills to update (max +10 levels per session)",
-                               font=('Segoe UI', 12), 
+                               font=self.font_large, 
                                fg=self.colors["fg_text"],
                                bg=self.colors["bg_main"])
         instructions.pack(pady=(0, 15))
@@ -390,7 +618,7 @@ class SoloLevelingGUI:
                 text="Custom Date (YYYY-MM-DD):", 
                 bg=self.colors["bg_frame"],
                 fg=self.colors["fg_text"],
-                font=('Segoe UI', 10)).pack(side=tk.LEFT, padx=10, pady=10)
+                font=self.font_body).pack(side=tk.LEFT, padx=10, pady=10)
         
         self.custom_date_var = tk.StringVar()
         date_entry = tk.Entry(date_frame, 
@@ -399,7 +627,7 @@ class SoloLevelingGUI:
                              bg=self.colors["bg_secondary"],
                              fg=self.colors["fg_text"],
                              insertbackground=self.colors["fg_text"],
-                             font=('Segoe UI', 10),
+                             font=self.font_body,
                              relief=tk.FLAT,
                              bd=5)
         date_entry.pack(side=tk.LEFT, padx=(5, 10), pady=10)
@@ -414,75 +642,55 @@ class SoloLevelingGUI:
         attr_notebook.pack(fill=tk.BOTH, expand=True, pady=(0, 15))
         
         self.update_entries = {}
+        self.pending_levels = {}  # (attribute, skill) -> typed new level
+        current_skills = self.get_current_skills()
+        
+        # One entry is shared by every tab and placed over whichever cell is being edited
+        self._edit_var = tk.StringVar()
+        self._edit_target = None
+        self._edit_entry = tk.Entry(attr_notebook,
+                                    textvariable=self._edit_var,
+                                    bg=self.colors["bg_secondary"],
+                                    fg=self.colors["fg_text"],
+                                    insertbackground=self.colors["fg_text"],
+                                    font=self.font_body,
+                                    relief=tk.FLAT,
+                                    bd=2)
+        self._edit_entry.bind('<Return>', self._commit_skill_edit)
+        self._edit_entry.bind('<FocusOut>', self._commit_skill_edit)
+        self._edit_entry.bind('<Escape>', self._cancel_skill_edit)
         
         for attribute in self.attributes:
             # Create frame for this attribute
             attr_frame = ttk.Frame(attr_notebook)
-            attr_name_display = attribute.replace("_", " ").title()
+            attr_name_display = self._attr_display[attribute]
             attr_notebook.add(attr_frame, text=attr_name_display)
             
-            # Create scrollable frame
-            canvas = tk.Canvas(attr_frame, bg=self.colors["bg_main"], highlightthickness=0)
-            scrollbar = ttk.Scrollbar(attr_frame, orient="vertical", command=canvas.yview)
-            scrollable_frame = tk.Frame(canvas, bg=self.colors["bg_main"])
-            
-            scrollable_frame.bind(
-                "<Configure>",
-                lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-            )
-            
-            canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-            canvas.configure(yscrollcommand=scrollbar.set)
-            
-            canvas.pack(side="left", fill="both", expand=True)
-            scrollbar.pack(side="right", fill="y")
+            # One Treeview row per skill instead of a Frame/Label/Label/Entry stack
+            tree = ttk.Treeview(attr_frame, columns=('current', 'new'), show='tree headings',
+                                height=len(self.attributes[attribute]))
+            tree.heading('#0', text='Skill')
+            tree.heading('current', text='Current')
+            tree.heading('new', text='New Level (double-click)')
+            tree.column('#0', width=320)
+            tree.column('current', width=100, anchor='center')
+            tree.column('new', width=180, anchor='center')
+            tree.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
+            tree.bind('<Double-1>', lambda e, a=attribute: self._start_skill_edit(e, a))
             
             # Add skills to this attribute
             self.update_entries[attribute] = {}
-            skills = self.get_current_skills().get(attribute, {})
+            skills = current_skills.get(attribute, {})
             
-            for i, skill in enumerate(self.attributes[attribute]):
-                skill_frame = tk.Frame(scrollable_frame, bg=self.colors["bg_frame"])
-                skill_frame.pack(fill=tk.X, padx=15, pady=8)
-                
-                skill_display = skill.replace("_", " ").title()
+            for skill in self.attributes[attribute]:
+                skill_display = self._skill_display[skill]
                 current_level = skills.get(skill, 1)
                 
-                # Skill label
-                label = tk.Label(skill_frame, 
-                               text=f"{skill_display}:", 
-                               font=('Segoe UI', 10), 
-                               bg=self.colors["bg_frame"],
-                               fg=self.colors["fg_text"],
-                               width=30, 
-                               anchor='e')
-                label.pack(side=tk.LEFT, padx=(10, 5), pady=10)
-                
-                # Current level display
-                current_label = tk.Label(skill_frame, 
-                                       text=f"[{current_level}]", 
-                                       font=('Segoe UI', 10, 'bold'), 
-                                       bg=self.colors["bg_frame"],
-                                       fg=self.colors["fg_accent"])
-                current_label.pack(side=tk.LEFT, padx=10, pady=10)
-                
-                # New level entry
-                entry_var = tk.StringVar()
-                entry = tk.Entry(skill_frame, 
-                               textvariable=entry_var, 
-                               width=8,
-                               bg=self.colors["bg_secondary"],
-                               fg=self.colors["fg_text"],
-                               insertbackground=self.colors["fg_text"],
-                               font=('Segoe UI', 10),
-                               relief=tk.FLAT,
-                               bd=5)
-                entry.pack(side=tk.LEFT, padx=(10, 15), pady=10)
+                tree.insert('', 'end', iid=skill, text=skill_display, values=(f"[{current_level}]", ''))
                 
                 self.update_entries[attribute][skill] = {
-                    'var': entry_var,
                     'current': current_level,
-                    'label': current_label
+                    'tree': tree
                 }
         
         # Update button
@@ -491,13 +699,147 @@ class SoloLevelingGUI:
                                                 self.process_skill_updates,
                                                 self.colors["fg_accent"])
         update_button.pack(pady=15)
-        update_button.config(font=('Segoe UI', 14, 'bold'))
+        update_button.config(font=self.font_button_large)
+    
+    def _start_skill_edit(self, event, attribute):
+        """Open the shared entry over the new-level cell of the double-clicked row"""
+        tree = event.widget
+        skill = tree.identify_row(event.y)
+        if not skill:
+            return
+        
+        self._commit_skill_edit()
+        bbox = tree.bbox(skill, 'new')
+        if not bbox:  # Row scrolled out of view
+            return
+        x, y, width, height = bbox
+        self._edit_target = (attribute, skill)
+        self._edit_var.set(tree.set(skill, 'new'))
+        self._edit_entry.place(in_=tree, x=x, y=y, width=width, height=height)
+        self._edit_entry.focus_set()
+        self._edit_entry.select_range(0, tk.END)
+    
+    def _commit_skill_edit(self, event=None):
+        """Write the shared entry's text back to its row and hide the entry"""
+        if self._edit_target is None:
+            return
+        
+        attribute, skill = self._edit_target
+        value = self._edit_var.get().strip()
+        self.update_entries[attribute][skill]['tree'].set(skill, 'new', value)
+        if value:
+            self.pending_levels[(attribute, skill)] = value
+        else:
+            self.pending_levels.pop((attribute, skill), None)
+        self._cancel_skill_edit()
+    
+    def _cancel_skill_edit(self, event=None):
+        """Hide the shared entry without saving its text"""
+        self._edit_target = None
+        self._edit_entry.place_forget()
     
-    def setup_progress_tab(self):
+    def process_skill_updates(self):
+        """Process skill updates from the update tab"""
+        self._commit_skill_edit()  # Keep a value still being typed
+        updates = []
+        total_gains = 0
+        
+        for attribute, entries in self.update_entries.items():
+            for skill, entry_data in entries.items():
+                new_value = self.pending_levels.get((attribute, skill))
+                if not new_value:
+                    continue
+                current_level = entry_data['current']
+                
+                try:
+                    new_level = int(new_value)
+                except ValueError:
+                    messagebox.showerror("Error", f"Invalid level for {skill}!")
+                    return
+                
+                # Validation
+                if new_level < current_level:
+                    messagebox.showerror("Error", f"Cannot decrease {skill} level!")
+                    return
+                
+                if new_level > current_level + 10:
+                    messagebox.showerror("Error", f"Max +10 increase for {skill}!")
+                    return
+                
+                if new_level > 100:
+                    messagebox.showerror("Error", f"Max level is 100 for {skill}!")
+                    return
+                
+                if new_level > current_level:
+                    gain = new_level - current_level
+                    updates.append((attribute, skill, current_level, new_level, gain))
+                    total_gains += gain
+        
+        if not updates:
+            messagebox.showinfo("No Updates", "No changes to save.")
+            return
+        
+        # Get custom date if provided
+        custom_date = self.custom_date_var.get().strip()
+        if custom_date:
+            try:
+                session_date = datetime.strptime(custom_date, "%Y-%m-%d")
+                timestamp = int(datetime.combine(session_date.date(), datetime.now().time()).timestamp())
+            except ValueError:
+                messagebox.showerror("Error", "Invalid date format. Use YYYY-MM-DD")
+                return
+        else:
+            timestamp = int(datetime.now().timestamp())
+        
+        # Save to database
+        self.save_update_session(timestamp, updates, total_gains)
+        
+        messagebox.showinfo("Success!", f"Updated {len(updates)} skills with +{total_gains} total levels!")
+        
+        # Show the new levels and clear the typed values
+        for attribute, skill, old_level, new_level, gain in updates:
+            entry_data = self.update_entries[attribute][skill]
+            entry_data['current'] = new_level
+            entry_data['tree'].item(skill, values=(f"[{new_level}]", ''))
+        for attribute, skill in self.pending_levels:
+            self.update_entries[attribute][skill]['tree'].set(skill, 'new', '')
+        self.pending_levels.clear()
+        
+        self.custom_date_var.set("")
+        self.refresh_all_data()
+    
+    def save_update_session(self, timestamp: int, updates: list, total_gains: int,
+                            session_type: str = "skill_update", notes: str = None):
+        """Save update session to database in a single transaction"""
+        cursor = self.conn.cursor()
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            cursor.execute('''
+                INSERT INTO sessions (session_timestamp, total_gains, session_type, notes)
+                VALUES (?, ?, ?, ?)
+            ''', (timestamp, total_gains, session_type, notes))
+            
+            session_id = cursor.lastrowid
+            
+            cursor.executemany(
+                'UPDATE skills SET current_level = ?, last_updated = ? WHERE id = ?',
+                [(new_level, timestamp, self._skill_id[(attribute, skill)])
+                 for attribute, skill, old_level, new_level, gain in updates]
+            )
+            
+            cursor.executemany('''
+                INSERT INTO session_updates (session_id, attribute, skill_name, old_level, new_level, gain)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', [(session_id, *update) for update in updates])
+        except BaseException:
+            # Leave the connection usable for the next save attempt
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+        self._invalidate_skills_cache()
+    
+    def setup_progress_tab(self, progress_frame):
         """Setup the progress visualization tab"""
-        progress_frame = ttk.Frame(self.notebook)
-        self.notebook.add(progress_frame, text="📈 Progress Charts")
-        
         # Main container
         main_container = tk.Frame(progress_frame, bg=self.colors["bg_main"])
         main_container.pack(fill=tk.BOTH, expand=True)
@@ -507,6 +849,24 @@ class SoloLevelingGUI:
         self.canvas = FigureCanvasTkAgg(self.fig, main_container)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
         
+        # One Axes per chart kind, created once; the show_* methods update their artists in
+        # place (set_height/set_data) and switch visibility instead of clearing the figure
+        self.ax_attr = self.fig.add_subplot(111, label='attribute', facecolor=self.colors["bg_frame"])
+        self.ax_progress = self.fig.add_subplot(111, label='progress', facecolor=self.colors["bg_frame"])
+        self.ax_heat = self.fig.add_subplot(111, label='heatmap', facecolor=self.colors["bg_frame"])
+        self._chart_axes = (self.ax_attr, self.ax_progress, self.ax_heat)
+        for ax in self._chart_axes:
+            ax.set_visible(False)
+        self._chart_artists = {}  # Artists of each drawn chart, keyed by its Axes
+        self._chart_redraws = {self.ax_attr: self.show_attribute_chart,
+                               self.ax_progress: self.show_progress_chart,
+                               self.ax_heat: self.show_skill_heatmap}
+        self._shown_chart_ax = None
+        
+        # Full redraws (first draw, resize) save a background that data updates blit onto
+        self._chart_background = None
+        self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
+        
         # Chart selection buttons
         chart_frame = tk.Frame(main_container, bg=self.colors["bg_main"])
         chart_frame.pack(fill=tk.X, pady=(0, 15))
@@ -526,17 +886,178 @@ class SoloLevelingGUI:
         # Show initial chart
         self.show_attribute_chart()
     
-    def setup_history_tab(self):
+    def _activate_chart_axes(self, ax):
+        """Show only the given chart Axes and schedule a redraw"""
+        for chart_ax in self._chart_axes:
+            chart_ax.set_visible(chart_ax is ax)
+        self._shown_chart_ax = ax
+        self.canvas.draw_idle()
+    
+    def _animated_artists(self):
+        """Animated artists of the chart on screen (skipped by full draws)"""
+        artists = self._chart_artists.get(self._shown_chart_ax)
+        return artists.get('animated', ()) if artists else ()
+    
+    def _on_canvas_draw(self, event):
+        """Re-capture the blit background after any full redraw and paint the animated artists"""
+        self._chart_background = self.canvas.copy_from_bbox(self.fig.bbox)
+        for artist in self._animated_artists():
+            self.fig.draw_artist(artist)
+    
+    def _blit_chart(self):
+        """Repaint only the animated artists over the saved background"""
+        if self._chart_background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._chart_background)
+        for artist in self._animated_artists():
+            self.fig.draw_artist(artist)
+        self.canvas.blit(self.fig.bbox)
+    
+    def show_attribute_chart(self):
+        """Show attribute levels chart"""
+        attr_levels = self._attribute_levels()
+        levels = [attr_levels[attribute] for attribute in self.attributes]
+        ax = self.ax_attr
+        chart = self._chart_artists.get(ax)
+        
+        if chart is not None:
+            # Bars already exist: move them and their labels to the new levels
+            for bar, label, level in zip(chart['bars'], chart['labels'], levels):
+                bar.set_height(level)
+                label.xy = (label.xy[0], level)
+                label.set_text(f'{level}')
+            if self._shown_chart_ax is ax:
+                self._blit_chart()
+            else:
+                self._activate_chart_axes(ax)
+            return
+        
+        bars = ax.bar([self._attr_display[attribute] for attribute in self.attributes], levels,
+                      color=[self.colors["fg_accent"], self.colors["error"], self.colors["success"],
+                             self.colors["warning"], self.colors["highlight"]])
+        
+        ax.set_title('Current Attribute Levels', fontsize=16, fontweight='bold',
+                     color=self.colors["fg_accent"])
+        ax.set_ylabel('Level', fontsize=12, color=self.colors["fg_text"])
+        ax.set_ylim(0, 100)
+        ax.tick_params(colors=self.colors["fg_text"])
+        
+        # Add value labels on bars
+        labels = ax.bar_label(bars, padding=3, fontweight='bold', color=self.colors["fg_text"])
+        
+        # Rotate x-axis labels for better readability
+        plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+        
+        # The y-axis is fixed at 0-100, so later level changes can be blitted
+        animated = [*bars, *labels]
+        for artist in animated:
+            artist.set_animated(True)
+        self._chart_artists[ax] = {'bars': list(bars), 'labels': labels, 'animated': animated}
+        
+        # Lay out after the Axes is made visible; tight_layout ignores hidden Axes
+        self._activate_chart_axes(ax)
+        self.fig.tight_layout()
+    
+    def show_progress_chart(self):
+        """Show cumulative level gains over time"""
+        ax = self.ax_progress
+        chart = self._chart_artists.get(ax)
+        first_draw = chart is None
+        if first_draw:
+            chart = self._chart_artists[ax] = self._init_progress_axes(ax)
+        
+        # Running totals come from the window function; timestamps are epoch seconds
+        df = pd.read_sql_query('''
+            SELECT session_timestamp AS ts,
+                   SUM(total_gains) OVER (ORDER BY session_timestamp, id) AS cumulative
+            FROM sessions
+            ORDER BY session_timestamp, id
+        ''', self.conn)
+        chart['empty'].set_visible(df.empty)
+        
+        if not df.empty:
+            from dateutil.tz import tzlocal  # matplotlib dependency, already loaded
+            dates = (pd.to_datetime(df['ts'], unit='s', utc=True)
+                     .dt.tz_convert(tzlocal()).dt.tz_localize(None))
+            
+            # Long histories are decimated to about one point pair per pixel column
+            x, y = min_max_decimate(mdates.date2num(dates.to_numpy()),
+                                    df['cumulative'].to_numpy(dtype=np.float64),
+                                    int(self.fig.get_figwidth() * self.fig.dpi))
+            
+            # Move the existing line and reshape the fill: along the line, then back along y=0
+            chart['line'].set_data(x, y)
+            verts = np.column_stack([np.r_[x, x[::-1]], np.r_[y, np.zeros_like(y)]])
+            chart['fill'].set_verts([verts])
+            ax.relim()
+            ax.update_datalim(verts)
+            ax.autoscale_view()
+        
+        if self._shown_chart_ax is ax:
+            self.canvas.draw_idle()  # Limits may have moved, so this needs a full redraw
+        else:
+            self._activate_chart_axes(ax)
+        if first_draw:
+            self.fig.tight_layout()
+    
+    def _init_progress_axes(self, ax):
+        """Create the progress chart's artists and labels once; later calls only move data"""
+        line, = ax.plot([], [], marker='o', linewidth=2, markersize=6, color=self.colors["fg_accent"])
+        fill = ax.fill_between([], [], alpha=0.3, color=self.colors["fg_accent"])
+        empty = ax.text(0.5, 0.5, 'No session data yet!\nComplete some skill updates to see progress.',
+                        ha='center', va='center', transform=ax.transAxes, fontsize=14,
+                        color=self.colors["fg_secondary"])
+        
+        ax.set_title('Cumulative Level Gains Over Time', fontsize=16, fontweight='bold',
+                     color=self.colors["fg_accent"])
+        ax.set_ylabel('Total Level Gains', fontsize=12, color=self.colors["fg_text"])
+        ax.set_xlabel('Date', fontsize=12, color=self.colors["fg_text"])
+        ax.tick_params(colors=self.colors["fg_text"])
+        
+        # Date ticks on the x-axis; ticks added later copy the existing ones' rotation
+        ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
+        plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+        ax.grid(True, alpha=0.3)
+        
+        return {'line': line, 'fill': fill, 'empty': empty, 'animated': ()}
+    
+    def show_skill_heatmap(self):
+        """Show skill levels heatmap"""
+        import seaborn as sns  # Only the heatmap uses seaborn, so its import cost is paid here
+        
+        # One query pivoted into an attribute x skill-slot matrix; slots follow seeding order
+        df = pd.read_sql_query('''
+            SELECT attribute,
+                   ROW_NUMBER() OVER (PARTITION BY attribute ORDER BY id) AS slot,
+                   current_level
+            FROM skills
+        ''', self.conn)
+        matrix = (df.pivot(index='attribute', columns='slot', values='current_level')
+                  .reindex(list(self.attributes))
+                  .rename(index=self._attr_display, columns=lambda slot: f'Skill {slot}'))
+        
+        ax = self.ax_heat
+        ax.clear()
+        sns.heatmap(matrix, ax=ax, cmap='RdYlGn', vmin=1, vmax=100, annot=True, fmt='g',
+                    cbar=False, linewidths=0.5, linecolor=self.colors["bg_main"])
+        ax.set_title('Skill Levels Heatmap', fontsize=16, fontweight='bold',
+                     color=self.colors["fg_accent"])
+        ax.set_xlabel('')
+        ax.set_ylabel('')
+        ax.tick_params(colors=self.colors["fg_text"])
+        
+        self._activate_chart_axes(ax)
+    
+    def setup_history_tab(self, history_frame):
         """Setup the session history tab"""
-        history_frame = ttk.Frame(self.notebook)
-        self.notebook.add(history_frame, text="📚 Session History")
-        
         # Main container
         main_container = tk.Frame(history_frame, bg=self.colors["bg_main"])
         main_container.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
         
         # Create treeview for session history
-        columns = ('Date', 'Type', 'Total Gains', 'Notes')
+        columns = ('Date', 'Type', 'Total Gains', 'Skills', 'Notes')
         self.history_tree = ttk.Treeview(main_container, columns=columns, show='headings', height=15)
         
         # Define headings
@@ -556,6 +1077,57 @@ class SoloLevelingGUI:
         
         self.refresh_history_display()
     
+    def refresh_history_display(self):
+        """Refresh the session history display"""
+        cursor = self.conn.cursor()
+        
+        # One join returns every session with its skill count; SQLite formats the epoch date
+        cursor.execute('''
+            SELECT strftime('%Y-%m-%d %H:%M', s.session_timestamp, 'unixepoch', 'localtime'),
+                   s.session_type, s.total_gains, COUNT(u.id), s.notes
+            FROM sessions s
+            LEFT JOIN session_updates u ON u.session_id = s.id
+            GROUP BY s.id
+            ORDER BY s.session_timestamp DESC, s.id DESC
+            LIMIT 500
+        ''')
+        
+        self.history_tree.delete(*self.history_tree.get_children())
+        for formatted_date, session_type, total_gains, skill_count, notes in cursor.fetchall():
+            session_type_display = self._session_type_display.get(session_type)
+            if session_type_display is None:
+                session_type_display = session_type.replace("_", " ").title()
+                self._session_type_display[session_type] = session_type_display
+            
+            self.history_tree.insert('', 'end', values=(
+                formatted_date,
+                session_type_display,
+                f"+{total_gains}",
+                skill_count,
+                notes or ""
+            ))
+    
+    def refresh_all_data(self):
+        """Re-read the skills table and refresh every view that has been built"""
+        self._invalidate_skills_cache()
+        
+        max_level = len(self.attributes) * 100
+        self.overall_level_label.config(text=f"🏆 OVERALL LEVEL: {self.calculate_overall_level()}/{max_level}")
+        self.refresh_stats_display()
+        
+        # Deferred tabs that were never opened build from fresh data when first selected
+        if hasattr(self, 'update_entries'):
+            current_skills = self.get_current_skills()
+            for attribute, entries in self.update_entries.items():
+                for skill, entry_data in entries.items():
+                    level = current_skills.get(attribute, {}).get(skill, 1)
+                    entry_data['current'] = level
+                    entry_data['tree'].set(skill, 'current', f"[{level}]")
+        if hasattr(self, 'history_tree'):
+            self.refresh_history_display()
+        if getattr(self, '_shown_chart_ax', None) is not None:
+            self._chart_redraws[self._shown_chart_ax]()
+    
     def show_crystal_ball_welcome(self):
         """Show welcome dialog for first-time users"""
         # Create custom dialog with Tokyo Night theme
@@ -640,7 +1212,7 @@ class SoloLevelingGUI:
                                     "• 41-60: Intermediate proficiency\n"
                                     "• 61-80: Advanced/Skilled\n"
                                     "• 81-100: Expert/Master level",
-                               font=('Segoe UI', 10), 
+                               font=self.font_body, 
                                fg=self.colors["fg_text"], 
                                bg=self.colors["bg_frame"],
                                justify=tk.LEFT)
@@ -654,24 +1226,11 @@ class SoloLevelingGUI:
         
         for attribute in self.attributes:
             attr_frame = ttk.Frame(crystal_notebook)
-            attr_name_display = attribute.replace("_", " ").title()
+            attr_name_display = self._attr_display[attribute]
             crystal_notebook.add(attr_frame, text=attr_name_display)
             
             # Create scrollable frame
-            canvas = tk.Canvas(attr_frame, bg=self.colors["bg_main"], highlightthickness=0)
-            scrollbar = ttk.Scrollbar(attr_frame, orient="vertical", command=canvas.yview)
-            scrollable_frame = tk.Frame(canvas, bg=self.colors["bg_main"])
-            
-            scrollable_frame.bind(
-                "<Configure>",
-                lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-            )
-            
-            canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-            canvas.configure(yscrollcommand=scrollbar.set)
-            
-            canvas.pack(side="left", fill="both", expand=True)
-            scrollbar.pack(side="right", fill="y")
+            canvas, scrollable_frame = self._make_scrollable(attr_frame)
             
             crystal_entries[attribute] = {}
             
@@ -679,9 +1238,80 @@ class SoloLevelingGUI:
                 skill_frame = tk.Frame(scrollable_frame, bg=self.colors["bg_frame"])
                 skill_frame.pack(fill=tk.X, padx=15, pady=8)
                 
-                skill_display = skill.replace("_", " ").title()
+                skill_display = self._skill_display[skill]
                 
                 label = tk.Label(skill_frame, 
                                text=f"🔍 {skill_display}:", 
-                               font=('Segoe UI', 10), 
-                
\ No newline at end of file
+                               font=self.font_body, 
+                               fg=self.colors["fg_text"], 
+                               bg=self.colors["bg_frame"],
+                               width=30, 
+                               anchor='e')
+                label.pack(side=tk.LEFT)
+                
+                entry_var = tk.StringVar(value="1")
+                entry = tk.Entry(skill_frame, 
+                                textvariable=entry_var, 
+                                width=5,
+                                bg=self.colors["bg_secondary"],
+                                fg=self.colors["fg_text"],
+                                insertbackground=self.colors["fg_text"],
+                                font=self.font_body,
+                                relief=tk.FLAT,
+                                bd=3)
+                entry.pack(side=tk.LEFT, padx=10)
+                
+                crystal_entries[attribute][skill] = entry_var
+        
+        # Buttons
+        button_frame = tk.Frame(crystal_window, bg=self.colors["bg_main"])
+        button_frame.pack(fill=tk.X, padx=20, pady=(0, 15))
+        
+        def save_crystal_assessment():
+            try:
+                self.process_crystal_ball_assessment(crystal_entries)
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to save assessment: {str(e)}")
+                return
+            crystal_window.destroy()
+            messagebox.showinfo("✨ Assessment Complete!", 
+                               "The crystal has revealed your true power!\n"
+                               "Your stats have been updated.")
+            self.refresh_all_data()
+        
+        self.create_tokyo_button(button_frame, "✨ Complete Assessment", 
+                                save_crystal_assessment, self.colors["highlight"]).pack(side=tk.LEFT, padx=(0, 10))
+        
+        self.create_tokyo_button(button_frame, "❌ Cancel", 
+                                crystal_window.destroy, self.colors["error"]).pack(side=tk.LEFT)
+    
+    def process_crystal_ball_assessment(self, entries: dict):
+        """Save the crystal ball ratings as one assessment session"""
+        timestamp = int(datetime.now().timestamp())
+        updates = []
+        total_gains = 0
+        
+        for attribute, skills in entries.items():
+            for skill, entry_var in skills.items():
+                try:
+                    new_level = max(1, min(100, int(entry_var.get() or 1)))  # Clamp to 1-100
+                except ValueError:
+                    new_level = 1
+                gain = new_level - 1  # The assessment rates skills from level 1
+                updates.append((attribute, skill, 1, new_level, gain))
+                total_gains += gain
+        
+        self.save_update_session(timestamp, updates, total_gains, "crystal_ball_assessment",
+                                 "Initial stat assessment using the mystical crystal ball")
+    
+    def run(self):
+        """Start the GUI application"""
+        self.root.mainloop()
+
+def main():
+    """Main function to run the Solo Leveling System"""
+    app = SoloLevelingGUI()
+    app.run()
+
+if __name__ == "__main__":
+    main()